@@ -6,13 +6,18 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=['app.engine', 'app.appstore_engine', 'app.async_client'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        'tkinter.test', 'unittest', 'pydoc', 'email.test', 'test',
+        'distutils', 'numpy.testing', 'scipy', 'matplotlib',
+        # Dev tools that leak in when building from a development environment
+        'IPython', 'jedi', 'pytest', '_pytest',
+    ],
     noarchive=False,
-    optimize=0,
+    optimize=2,
 )
 pyz = PYZ(a.pure)
 
@@ -24,8 +29,8 @@ exe = EXE(
     name='App Store Review Scraper',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
+    strip=True,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -37,8 +42,8 @@ coll = COLLECT(
     exe,
     a.binaries,
     a.datas,
-    strip=False,
-    upx=True,
+    strip=True,
+    upx=False,
     upx_exclude=[],
     name='App Store Review Scraper',
 )
@@ -3,16 +3,130 @@ Apple App Store scraping engine using iTunes RSS Feed API.
 This is the most reliable method as it uses Apple's official public RSS feeds.
 """
 
-import requests
+import asyncio
+import itertools
+import math
+import httpx
+import orjson
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Any
 from datetime import datetime
+from app.async_client import get_async_client
+from app import cache
+from app.cache import cached, APP_INFO_TTL, REVIEWS_TTL
+from app.multi_country import fetch_countries, fetch_countries_async
+from app.validators import validate_app_name  # noqa: F401  (re-exported)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared HTTP/2 client: concurrent page and country requests to
+# itunes.apple.com are multiplexed over one kept-alive connection instead of
+# a TCP/TLS handshake each. Transport retries cover failed connection attempts.
+_client = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        retries=3
+    ),
+    timeout=10.0,
+    headers={"User-Agent": "AppStoreReviewScraper/0.2.0"}
+)
 
+# Absorb transient failures (honoring Retry-After on 429) so one bad
+# response doesn't drop a page or country from the results
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+MAX_RETRY_DELAY = 30.0
+
+# The customer reviews feed serves at most 10 pages of 50 reviews each
+RSS_PAGE_SIZE = 50
+RSS_MAX_PAGES = 10
+
+# Countries queried by fetch_reviews_multi_country when none are given
+_DEFAULT_ITUNES_COUNTRIES = ('us', 'gb', 'ca', 'au', 'de', 'fr', 'jp', 'kr')
+
+# Review field -> key path into a raw feed entry
+_REVIEW_PATHS = (
+    ("review_id", ("id", "label")),
+    ("user_name", ("author", "name", "label")),
+    ("rating", ("im:rating", "label")),
+    ("date", ("updated", "label")),
+    ("title", ("title", "label")),
+    ("text", ("content", "label")),
+    ("version", ("im:version", "label")),
+    ("vote_sum", ("im:voteSum", "label")),
+    ("vote_count", ("im:voteCount", "label")),
+)
+
+# Values for fields missing from an entry (anything not listed falls back to '')
+_REVIEW_DEFAULTS = {
+    "user_name": "Anonymous",
+    "rating": "N/A",
+    "version": "N/A",
+    "vote_sum": "0",
+    "vote_count": "0",
+}
+
+_APP_ID_SUGGESTION = (
+    "Find the numeric app ID from the App Store URL "
+    "(e.g., '284882215' from apps.apple.com/app/facebook/id284882215)"
+)
+
+
+def _resolve_app_id(app_name: str, app_id: Optional[str]) -> Optional[str]:
+    """Return the app ID to fetch; a numeric app_name is the ID itself."""
+    return app_name if app_name.isdigit() else app_id
+
+
+def _missing_app_id_error(app_name: str) -> Dict[str, Any]:
+    """Build the error dict returned when no numeric app ID is available."""
+    return {
+        "error": "App ID is required for App Store scraping",
+        "app_name": app_name,
+        "suggestion": _APP_ID_SUGGESTION
+    }
+
+
+def _fetch_error(e: Exception, what: str, app_id: str) -> Dict[str, Any]:
+    """Log a failed fetch and build its error dict."""
+    if isinstance(e, httpx.HTTPError):
+        error_msg = f"Network error: {str(e)}"
+    else:
+        error_msg = f"Error fetching {what}: {str(e)}"
+    logger.error(error_msg)
+    return {
+        "error": error_msg,
+        "app_id": app_id
+    }
+
+
+def _parse_app_info(data: Dict[str, Any], app_id: str, country: str) -> Dict[str, Any]:
+    """Build the app info dictionary from a decoded iTunes RSS feed page."""
+    feed = data.get('feed', {})
+    
+    entries = feed.get('entry') or []
+    # A feed with only the app info row is not wrapped in a list
+    if isinstance(entries, dict):
+        entries = [entries]
+
+    # First entry contains app info
+    app_entry = entries[0] if entries else {}
+    
+    return {
+        "app_id": app_id,
+        "app_name": app_entry.get('im:name', {}).get('label', 'N/A'),
+        "country": country,
+        "link": app_entry.get('link', {}).get('attributes', {}).get('href', 'N/A'),
+        "icon": app_entry.get('im:image', [{}])[-1].get('label', 'N/A'),  # Get largest image
+        "fetched_at": datetime.now().isoformat(),
+        "method": "iTunes RSS Feed API"
+    }
+
+
+@cached("rss", APP_INFO_TTL)
 def fetch_app_info(
     app_name: str,
     country: str = "us",
@@ -30,22 +144,15 @@ def fetch_app_info(
         Dictionary containing app information or error details
     """
     try:
-        # Check if app_name is actually an app_id (numeric string)
-        if app_name.isdigit():
-            app_id = app_name
-        
+        app_id = _resolve_app_id(app_name, app_id)
         if not app_id:
-            return {
-                "error": "App ID is required for App Store scraping",
-                "app_name": app_name,
-                "suggestion": "Find the numeric app ID from the App Store URL (e.g., '284882215' from apps.apple.com/app/facebook/id284882215)"
-            }
+            return _missing_app_id_error(app_name)
         
-        logger.info(f"Fetching App Store info for ID: {app_id}")
+        logger.info("Fetching App Store info for ID: %s", app_id)
         
         # Fetch a small number of reviews to get app metadata
         url = f"https://itunes.apple.com/{country}/rss/customerreviews/id={app_id}/sortBy=mostRecent/json"
-        response = requests.get(url, timeout=10)
+        response = _get(url)
         
         if response.status_code != 200:
             return {
@@ -53,41 +160,223 @@ def fetch_app_info(
                 "app_id": app_id
             }
         
-        data = response.json()
-        feed = data.get('feed', {})
-        
-        # First entry contains app info
-        app_entry = feed.get('entry', [])[0] if feed.get('entry') else {}
+        app_info = _parse_app_info(orjson.loads(response.content), app_id, country)
         
-        app_info = {
-            "app_id": app_id,
-            "app_name": app_entry.get('im:name', {}).get('label', 'N/A'),
-            "country": country,
-            "link": app_entry.get('link', {}).get('attributes', {}).get('href', 'N/A'),
-            "icon": app_entry.get('im:image', [{}])[-1].get('label', 'N/A'),  # Get largest image
-            "fetched_at": datetime.now().isoformat(),
-            "method": "iTunes RSS Feed API"
-        }
-        
-        logger.info(f"Successfully fetched App Store info for: {app_info['app_name']}")
+        logger.info("Successfully fetched App Store info for: %s", app_info['app_name'])
         return app_info
         
-    except requests.exceptions.RequestException as e:
-        error_msg = f"Network error: {str(e)}"
-        logger.error(error_msg)
-        return {
-            "error": error_msg,
-            "app_id": app_id or app_name
-        }
     except Exception as e:
-        error_msg = f"Error fetching App Store info: {str(e)}"
-        logger.error(error_msg)
-        return {
-            "error": error_msg,
-            "app_id": app_id or app_name
-        }
+        return _fetch_error(e, "App Store info", app_id or app_name)
+
+
+def _reviews_url(country: str, app_id: str, sort: str, page: int = 1) -> str:
+    """Build the iTunes RSS customer reviews URL for one feed page."""
+    # Map sort options
+    sort_by = "mostRecent" if sort == "mostRecent" else "mostHelpful"
+    return f"https://itunes.apple.com/{country}/rss/customerreviews/page={page}/id={app_id}/sortBy={sort_by}/json"
+
+
+def _page_urls(country: str, app_id: str, sort: str, max_count: int) -> List[str]:
+    """Build the URLs of every feed page needed to cover max_count reviews."""
+    pages_needed = max(1, min(RSS_MAX_PAGES, math.ceil(max_count / RSS_PAGE_SIZE)))
+    return [_reviews_url(country, app_id, sort, page) for page in range(1, pages_needed + 1)]
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """
+    Return how long to wait before retrying a response, or None to stop.
+    
+    Honors a numeric Retry-After header, otherwise backs off exponentially.
+    """
+    if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+        return None
+    
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        delay = float(retry_after)
+    else:
+        delay = RETRY_BACKOFF_FACTOR * (2 ** attempt)
+    return min(delay, MAX_RETRY_DELAY)
+
+
+def _get(url: str) -> httpx.Response:
+    """
+    GET a URL through the shared client, retrying transient HTTP statuses.
+    
+    The last response is returned once retries are exhausted, so callers keep
+    handling non-200 statuses themselves.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        response = _client.get(url)
+        delay = _retry_delay(response, attempt)
+        if delay is None:
+            return response
+        time.sleep(delay)
+    
+    return response
+
+
+async def _aget(url: str) -> httpx.Response:
+    """Asynchronous variant of _get using the shared async client."""
+    client = get_async_client()
+    for attempt in range(MAX_RETRIES + 1):
+        response = await client.get(url)
+        delay = _retry_delay(response, attempt)
+        if delay is None:
+            return response
+        await asyncio.sleep(delay)
+    
+    return response
+
+
+def _fetch_pages(country: str, app_id: str, sort: str, max_count: int) -> List[httpx.Response]:
+    """
+    Fetch every feed page needed for max_count reviews through the shared client.
+    
+    Multiple pages are requested up front so wall-clock stays close to a
+    single-page fetch; a single page is fetched on the calling thread.
+    
+    Returns:
+        Responses in page order
+    """
+    urls = _page_urls(country, app_id, sort, max_count)
+    if len(urls) == 1:
+        return [_get(urls[0])]
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        return list(executor.map(_get, urls))
+
+
+def _iter_review_entries(feeds: Iterable[Optional[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield review entries from consecutive decoded feed pages.
+    
+    Pages are pulled from feeds lazily, so pages after the consumer stops are
+    never decoded. Stops at the first missing or empty page. The app info row
+    (which has no rating) and entries repeated across pages are dropped.
+    
+    Args:
+        feeds: Decoded feed pages in page order (None for a failed page)
+    
+    Yields:
+        Raw review entries
+    """
+    seen_ids = set()
+    
+    for data in feeds:
+        entries = data.get('feed', {}).get('entry', []) if data else []
+        # A feed page with a single entry is not wrapped in a list
+        if isinstance(entries, dict):
+            entries = [entries]
+        if not entries:
+            return
+        
+        for entry in entries:
+            if 'im:rating' not in entry:
+                continue
+            entry_id = entry.get('id', {}).get('label', '')
+            if entry_id in seen_ids:
+                continue
+            seen_ids.add(entry_id)
+            yield entry
+
+
+def _extract_review(entry: Dict[str, Any], _get=dict.get) -> Dict[str, Any]:
+    """Extract one review dictionary from a raw feed entry via _REVIEW_PATHS."""
+    review_info = {}
+    for key, path in _REVIEW_PATHS:
+        node = entry
+        for segment in path:
+            node = _get(node, segment) if type(node) is dict else None
+            if node is None:
+                break
+        review_info[key] = _REVIEW_DEFAULTS.get(key, '') if node is None else node
+    return review_info
+
+
+def _parse_reviews(
+    review_entries: Iterable[Dict[str, Any]],
+    app_id: str,
+    max_count: int,
+    text_only: bool
+) -> List[Dict[str, Any]]:
+    """
+    Parse raw iTunes RSS review entries into review dictionaries.
+    
+    Parsing stops as soon as max_count reviews are collected, so with
+    text_only the remaining entries (and undecoded pages) are skipped.
+    
+    Args:
+        review_entries: Raw review entries (see _iter_review_entries)
+        app_id: The app ID the feed was fetched for
+        max_count: Maximum number of reviews to return
+        text_only: If True, skip reviews without text
+    
+    Returns:
+        List of review dictionaries, or list with error dict
+    """
+    # Parse reviews
+    reviews = []
+    found_entries = False
+    for entry in review_entries:
+        found_entries = True
+        if len(reviews) >= max_count:
+            break
+        
+        review_info = _extract_review(entry)
+        
+        # Skip reviews without text if text_only is enabled
+        if text_only and not review_info["text"].strip():
+            continue
+        
+        reviews.append(review_info)
+    
+    if not found_entries:
+        return [{
+            "error": "No reviews found for this app",
+            "app_id": app_id,
+            "note": "The app may not have any reviews yet, or reviews may be disabled."
+        }]
+    
+    return reviews
+
+
+def _reviews_from_pages(
+    responses: List[httpx.Response],
+    app_id: str,
+    max_count: int,
+    text_only: bool
+) -> List[Dict[str, Any]]:
+    """
+    Turn fetched feed pages into the fetch_app_reviews result.
+    
+    Args:
+        responses: Feed page responses in page order
+        app_id: The app ID the feed was fetched for
+        max_count: Maximum number of reviews to return
+        text_only: If True, skip reviews without text
+    
+    Returns:
+        List of review dictionaries, or list with error dict
+    """
+    if responses[0].status_code != 200:
+        return [{
+            "error": f"Failed to fetch reviews (HTTP {responses[0].status_code})",
+            "app_id": app_id
+        }]
+    
+    review_entries = _iter_review_entries(
+        orjson.loads(response.content) if response.status_code == 200 else None
+        for response in responses
+    )
+    reviews = _parse_reviews(review_entries, app_id, max_count, text_only)
+    if reviews and "error" in reviews[0]:
+        return reviews
+    
+    logger.info("Successfully fetched %s App Store reviews%s", len(reviews), " (text only)" if text_only else "")
+    return reviews
 
 
+@cached("rss", REVIEWS_TTL)
 def fetch_app_reviews(
     app_name: str,
     country: str = "us",
@@ -111,94 +400,109 @@ def fetch_app_reviews(
         List of dictionaries containing review data, or list with error dict
     """
     try:
-        # Check if app_name is actually an app_id (numeric string)
-        if app_name.isdigit():
-            app_id = app_name
-        
+        app_id = _resolve_app_id(app_name, app_id)
         if not app_id:
-            return [{
-                "error": "App ID is required for App Store scraping",
-                "app_name": app_name,
-                "suggestion": "Find the numeric app ID from the App Store URL (e.g., '284882215' for Facebook)"
-            }]
+            return [_missing_app_id_error(app_name)]
         
-        logger.info(f"Fetching {count} App Store reviews for ID: {app_id}")
+        logger.info("Fetching %s App Store reviews for ID: %s", count, app_id)
         
-        # iTunes RSS Feed supports up to 500 reviews
-        # The feed is paginated - we'll fetch the first page
-        max_count = min(count, 500)
+        # iTunes RSS Feed supports up to 500 reviews over 10 pages
+        max_count = min(count, RSS_MAX_PAGES * RSS_PAGE_SIZE)
         
-        # Map sort options
-        sort_by = "mostRecent" if sort == "mostRecent" else "mostHelpful"
+        responses = _fetch_pages(country, app_id, sort, max_count)
+        return _reviews_from_pages(responses, app_id, max_count, text_only)
         
-        # Build URL
-        url = f"https://itunes.apple.com/{country}/rss/customerreviews/id={app_id}/sortBy={sort_by}/json"
+    except Exception as e:
+        return [_fetch_error(e, "App Store reviews", app_id or app_name)]
+
+
+def fetch_app_info_and_reviews(
+    app_name: str,
+    country: str = "us",
+    count: int = 100,
+    app_id: Optional[str] = None,
+    sort: str = "mostRecent",
+    text_only: bool = False
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Fetch app information and reviews for an App Store app in one go.
+    
+    The app info row comes from the first review feed page, so this costs the
+    same requests as fetch_app_reviews alone. Results are cached under the
+    keys of fetch_app_info and fetch_app_reviews, so later calls to either
+    with the same arguments are served from the cache.
+    
+    Args:
+        app_name: The app's name or app ID (e.g., '284882215')
+        country: Country code (default: 'us')
+        count: Maximum number of reviews to fetch (default: 100, max: 500)
+        app_id: Optional app ID if known
+        sort: Sort order - 'mostRecent' or 'mostHelpful' (default: 'mostRecent')
+        text_only: If True, only return reviews with text/comments (default: False)
+    
+    Returns:
+        Tuple of (app info dictionary, list of review dictionaries); on failure
+        these are an error dict and a list with an error dict
+    """
+    info_key = cache.make_key(
+        "rss", fetch_app_info, (app_name,), {"country": country, "app_id": app_id}
+    )
+    reviews_key = cache.make_key(
+        "rss",
+        fetch_app_reviews,
+        (app_name,),
+        {"country": country, "count": count, "app_id": app_id, "sort": sort, "text_only": text_only}
+    )
+    
+    app_info = cache.get(info_key)
+    reviews = cache.get(reviews_key)
+    if app_info is not None and reviews is not None:
+        return app_info, reviews
+    
+    try:
+        app_id = _resolve_app_id(app_name, app_id)
+        if not app_id:
+            error = _missing_app_id_error(app_name)
+            return error, [error]
         
-        response = requests.get(url, timeout=10)
+        logger.info("Fetching App Store info and %s reviews for ID: %s", count, app_id)
         
-        if response.status_code != 200:
-            return [{
-                "error": f"Failed to fetch reviews (HTTP {response.status_code})",
-                "app_id": app_id
-            }]
+        max_count = min(count, RSS_MAX_PAGES * RSS_PAGE_SIZE)
+        responses = _fetch_pages(country, app_id, sort, max_count)
         
-        data = response.json()
-        entries = data.get('feed', {}).get('entry', [])
+        status_code = responses[0].status_code
+        if status_code != 200:
+            return (
+                {"error": f"Failed to fetch app info (HTTP {status_code})", "app_id": app_id},
+                [{"error": f"Failed to fetch reviews (HTTP {status_code})", "app_id": app_id}]
+            )
         
-        # First entry is app info, rest are reviews
-        review_entries = entries[1:] if len(entries) > 1 else []
+        first_page = orjson.loads(responses[0].content)
+        app_info = _parse_app_info(first_page, app_id, country)
         
-        if not review_entries:
-            return [{
-                "error": "No reviews found for this app",
-                "app_id": app_id,
-                "note": "The app may not have any reviews yet, or reviews may be disabled."
-            }]
+        feeds = itertools.chain(
+            [first_page],
+            (
+                orjson.loads(response.content) if response.status_code == 200 else None
+                for response in responses[1:]
+            )
+        )
+        reviews = _parse_reviews(_iter_review_entries(feeds), app_id, max_count, text_only)
         
-        # Parse reviews
-        reviews = []
-        for entry in review_entries[:max_count]:
-            review_text = entry.get('content', {}).get('label', '')
-            
-            # Skip reviews without text if text_only is enabled
-            if text_only and not review_text.strip():
-                continue
-            
-            review_info = {
-                "review_id": entry.get('id', {}).get('label', ''),
-                "user_name": entry.get('author', {}).get('name', {}).get('label', 'Anonymous'),
-                "rating": entry.get('im:rating', {}).get('label', 'N/A'),
-                "date": entry.get('updated', {}).get('label', ''),
-                "title": entry.get('title', {}).get('label', ''),
-                "text": review_text,
-                "version": entry.get('im:version', {}).get('label', 'N/A'),
-                "vote_sum": entry.get('im:voteSum', {}).get('label', '0'),
-                "vote_count": entry.get('im:voteCount', {}).get('label', '0'),
-            }
-            reviews.append(review_info)
+        cache.put(info_key, APP_INFO_TTL, app_info)
+        cache.put(reviews_key, REVIEWS_TTL, reviews)
         
-        logger.info(f"Successfully fetched {len(reviews)} App Store reviews" + (" (text only)" if text_only else ""))
-        return reviews
+        logger.info("Successfully fetched App Store info and %s reviews for: %s", len(reviews), app_info['app_name'])
+        return app_info, reviews
         
-    except requests.exceptions.RequestException as e:
-        error_msg = f"Network error: {str(e)}"
-        logger.error(error_msg)
-        return [{
-            "error": error_msg,
-            "app_id": app_id or app_name
-        }]
     except Exception as e:
-        error_msg = f"Error fetching App Store reviews: {str(e)}"
-        logger.error(error_msg)
-        return [{
-            "error": error_msg,
-            "app_id": app_id or app_name
-        }]
+        error = _fetch_error(e, "App Store info and reviews", app_id or app_name)
+        return error, [error]
 
 
 def fetch_reviews_multi_country(
     app_name: str,
-    countries: List[str] = None,
+    countries: Sequence[str] = _DEFAULT_ITUNES_COUNTRIES,
     count_per_country: int = 100,
     app_id: Optional[str] = None,
     sort: str = "mostRecent",
@@ -209,7 +513,7 @@ def fetch_reviews_multi_country(
     
     Args:
         app_name: The app's name or app ID
-        countries: List of country codes (default: ['us', 'gb', 'ca', 'au', 'de', 'fr', 'jp', 'kr'])
+        countries: Country codes to fetch (default: ('us', 'gb', 'ca', 'au', 'de', 'fr', 'jp', 'kr'))
         count_per_country: Number of reviews to fetch per country (default: 100)
         app_id: Optional app ID if known
         sort: Sort order (default: 'mostRecent')
@@ -218,62 +522,98 @@ def fetch_reviews_multi_country(
     Returns:
         Combined list of reviews from all countries (duplicates removed by review_id)
     """
-    if countries is None:
-        countries = ['us', 'gb', 'ca', 'au', 'de', 'fr', 'jp', 'kr']
-    
-    all_reviews = []
-    seen_review_ids = set()
-    
-    logger.info(f"Fetching App Store reviews from {len(countries)} countries for: {app_name}")
-    
-    for country in countries:
-        try:
-            logger.info(f"Fetching from country: {country}")
-            reviews = fetch_app_reviews(
-                app_name=app_name,
-                country=country,
-                count=count_per_country,
-                app_id=app_id,
-                sort=sort,
-                text_only=text_only
-            )
-            
-            # Skip if error
-            if reviews and isinstance(reviews, list) and "error" in reviews[0]:
-                logger.warning(f"No reviews from {country}")
-                continue
-            
-            # Add unique reviews
-            for review in reviews:
-                review_id = review.get("review_id")
-                if review_id and review_id not in seen_review_ids:
-                    seen_review_ids.add(review_id)
-                    review["fetched_from_country"] = country
-                    all_reviews.append(review)
-        
-        except Exception as e:
-            logger.warning(f"Error fetching from {country}: {str(e)}")
-            continue
+    logger.info("Fetching App Store reviews from %s countries for: %s", len(countries), app_name)
+    
+    all_reviews = fetch_countries(
+        fetch_app_reviews,
+        countries,
+        app_name=app_name,
+        count=count_per_country,
+        app_id=app_id,
+        sort=sort,
+        text_only=text_only
+    )
     
-    logger.info(f"Total unique App Store reviews fetched: {len(all_reviews)}")
+    logger.info("Total unique App Store reviews fetched: %s", len(all_reviews))
     return all_reviews
 
 
-def validate_app_name(app_name: str) -> bool:
+@cached("rss", REVIEWS_TTL)
+async def fetch_app_reviews_async(
+    app_name: str,
+    country: str = "us",
+    count: int = 100,
+    app_id: Optional[str] = None,
+    sort: str = "mostRecent",
+    text_only: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Asynchronous variant of fetch_app_reviews using the shared async client.
+    
+    Args:
+        app_name: The app's name or app ID (e.g., '284882215')
+        country: Country code (default: 'us')
+        count: Maximum number of reviews to fetch (default: 100, max: 500)
+        app_id: Optional app ID if known
+        sort: Sort order - 'mostRecent' or 'mostHelpful' (default: 'mostRecent')
+        text_only: If True, only return reviews with text/comments (default: False)
+    
+    Returns:
+        List of dictionaries containing review data, or list with error dict
+    """
+    try:
+        app_id = _resolve_app_id(app_name, app_id)
+        if not app_id:
+            return [_missing_app_id_error(app_name)]
+        
+        logger.info("Fetching %s App Store reviews for ID: %s", count, app_id)
+        
+        max_count = min(count, RSS_MAX_PAGES * RSS_PAGE_SIZE)
+        
+        responses = await asyncio.gather(
+            *[_aget(url) for url in _page_urls(country, app_id, sort, max_count)]
+        )
+        return _reviews_from_pages(responses, app_id, max_count, text_only)
+        
+    except Exception as e:
+        return [_fetch_error(e, "App Store reviews", app_id or app_name)]
+
+
+async def fetch_reviews_multi_country_async(
+    app_name: str,
+    countries: Sequence[str] = _DEFAULT_ITUNES_COUNTRIES,
+    count_per_country: int = 100,
+    app_id: Optional[str] = None,
+    sort: str = "mostRecent",
+    text_only: bool = False
+) -> List[Dict[str, Any]]:
     """
-    Validate if an app name/ID is in a reasonable format.
+    Asynchronous variant of fetch_reviews_multi_country.
+    
+    All countries are requested concurrently on the current event loop.
     
     Args:
-        app_name: The app's name or ID to validate
+        app_name: The app's name or app ID
+        countries: Country codes to fetch (default: ('us', 'gb', 'ca', 'au', 'de', 'fr', 'jp', 'kr'))
+        count_per_country: Number of reviews to fetch per country (default: 100)
+        app_id: Optional app ID if known
+        sort: Sort order (default: 'mostRecent')
+        text_only: If True, only return reviews with text/comments (default: False)
     
     Returns:
-        True if valid format, False otherwise
+        Combined list of reviews from all countries (duplicates removed by review_id)
     """
-    if not app_name or not isinstance(app_name, str):
-        return False
+    logger.info("Fetching App Store reviews from %s countries for: %s", len(countries), app_name)
     
-    # Basic validation: should not be empty and should be reasonable length
-    if len(app_name.strip()) < 2:
-        return False
+    all_reviews = await fetch_countries_async(
+        fetch_app_reviews_async,
+        countries,
+        app_name=app_name,
+        count=count_per_country,
+        app_id=app_id,
+        sort=sort,
+        text_only=text_only
+    )
     
-    return True
+    logger.info("Total unique App Store reviews fetched: %s", len(all_reviews))
+    return all_reviews
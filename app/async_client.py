@@ -0,0 +1,112 @@
+"""
+Shared asynchronous HTTP client for the scraping engines.
+Uses httpx with HTTP/2 so concurrent requests to the same host are
+multiplexed over a single connection.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, AsyncIterator, Awaitable, Callable, Tuple
+
+import httpx
+
+# One client per event loop, since httpx connections are bound to the loop
+# that opened them. Each is paired with the async generator that closes it.
+_ClientEntry = Tuple[httpx.AsyncClient, AsyncIterator[None]]
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ClientEntry]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+async def _close_on_shutdown(
+    loop: asyncio.AbstractEventLoop,
+    client: httpx.AsyncClient
+) -> AsyncIterator[None]:
+    """
+    Hold client open until the generator is closed, then close it.
+
+    The event loop tracks started async generators and closes them in
+    shutdown_asyncgens(), which asyncio.run() calls before closing the loop,
+    so a client is closed even when the caller never calls close_async_client.
+    """
+    try:
+        yield
+    finally:
+        with _clients_lock:
+            if _clients.get(loop, (None,))[0] is client:
+                del _clients[loop]
+        await client.aclose()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the async client for the running event loop, creating it on first use.
+
+    Each loop gets its own client (e.g. successive ``asyncio.run`` calls, or
+    loops running on different threads). The client is closed when its loop
+    shuts down its async generators, or earlier by close_async_client.
+
+    Returns:
+        Shared httpx.AsyncClient for the current event loop
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        entry = _clients.get(loop)
+        if entry is not None:
+            return entry[0]
+
+        # The transport owns the connection pool, so HTTP/2 and limits are set
+        # there; its retries cover failed connection attempts
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            retries=3
+        )
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=10.0,
+            headers={"User-Agent": "AppStoreReviewScraper/0.2.0"}
+        )
+        closer = _close_on_shutdown(loop, client)
+        _clients[loop] = (client, closer)
+
+    # Step the closer to its yield now (it never awaits before it), which
+    # registers it with the loop for shutdown
+    try:
+        closer.asend(None).send(None)
+    except StopIteration:
+        pass
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the current event loop's client, if it has one."""
+    with _clients_lock:
+        entry = _clients.get(asyncio.get_running_loop())
+
+    if entry is not None:
+        await entry[1].aclose()
+
+
+def run_in_new_loop(make_coro: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run a coroutine to completion on a fresh event loop from synchronous code.
+
+    The loop's client is closed before the loop shuts down, so its
+    connections are not left bound to a dead loop.
+
+    Args:
+        make_coro: Zero-argument callable returning the coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    async def main():
+        try:
+            return await make_coro()
+        finally:
+            await close_async_client()
+
+    return asyncio.run(main())
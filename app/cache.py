@@ -0,0 +1,185 @@
+"""
+In-process response cache for the scraping engines.
+Results are stored serialized with a TTL; expired entries are kept as a
+stale fallback for when a fresh fetch fails.
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import threading
+import time
+import orjson
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# TTL policies (seconds): review feeds change slowly, app metadata even more so
+REVIEWS_TTL = 300
+APP_INFO_TTL = 3600
+
+# Upper bound on stored entries; least recently used entries are evicted first
+MAX_ENTRIES = 256
+
+_entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _is_error(result: Any) -> bool:
+    """Check whether a result uses the engines' error dict convention."""
+    if isinstance(result, dict):
+        return "error" in result
+    if isinstance(result, list) and result:
+        return isinstance(result[0], dict) and "error" in result[0]
+    return False
+
+
+def make_key(namespace: str, func: Callable, args: tuple, kwargs: dict) -> str:
+    """
+    Build a cache key for a call, independent of how arguments were passed.
+
+    Args:
+        namespace: Key prefix (e.g., 'rss' or 'gplay')
+        func: The function being called
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+
+    Returns:
+        Cache key string
+    """
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    raw = repr((func.__module__, func.__qualname__, tuple(bound.arguments.items())))
+    return f"{namespace}:" + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _lookup(key: str) -> Optional[Tuple[bool, Any]]:
+    """Return (is_fresh, value) for a stored key, or None on a miss."""
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            return None
+        _entries.move_to_end(key)
+
+    expires_at, payload = entry
+    return expires_at > time.monotonic(), orjson.loads(payload)
+
+
+def _store(key: str, ttl: int, result: Any) -> None:
+    """Serialize and store a successful result."""
+    try:
+        payload = orjson.dumps(result)
+    except TypeError:
+        # Not JSON-serializable; skip caching rather than fail the fetch
+        return
+    with _lock:
+        _entries[key] = (time.monotonic() + ttl, payload)
+        _entries.move_to_end(key)
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+
+
+def _resolve(key: str, cached: Optional[Tuple[bool, Any]], ttl: int, result: Any) -> Any:
+    """Store a freshly fetched result, or fall back to a stale entry on error."""
+    if _is_error(result):
+        if cached is not None:
+            logger.warning("Fetch failed, serving stale cache entry for %s", key)
+            return cached[1]
+        return result
+
+    _store(key, ttl, result)
+    return result
+
+
+def get_or_fetch(key: str, ttl: int, fetcher: Callable[[], Any]) -> Any:
+    """
+    Return a cached result for key, calling fetcher on a miss or expiry.
+
+    Error results are never cached. If the fetch fails and an expired entry
+    exists, that stale entry is returned instead of the error.
+
+    Args:
+        key: Cache key (see make_key)
+        ttl: Time to live in seconds for a fresh result
+        fetcher: Zero-argument callable performing the real fetch
+
+    Returns:
+        The cached or freshly fetched result
+    """
+    cached = _lookup(key)
+    if cached is not None and cached[0]:
+        return cached[1]
+
+    return _resolve(key, cached, ttl, fetcher())
+
+
+def get(key: str) -> Optional[Any]:
+    """
+    Return the fresh cached result for key, or None if missing or expired.
+
+    Args:
+        key: Cache key (see make_key)
+
+    Returns:
+        The cached result or None
+    """
+    cached_entry = _lookup(key)
+    if cached_entry is not None and cached_entry[0]:
+        return cached_entry[1]
+    return None
+
+
+def put(key: str, ttl: int, result: Any) -> None:
+    """
+    Store a result under key unless it is an error result.
+
+    Args:
+        key: Cache key (see make_key)
+        ttl: Time to live in seconds
+        result: The result to store
+    """
+    if not _is_error(result):
+        _store(key, ttl, result)
+
+
+def cached(namespace: str, ttl: int) -> Callable:
+    """
+    Decorator caching an engine function's result by its arguments.
+
+    Works for both regular and async functions.
+
+    Args:
+        namespace: Key prefix for the cached entries
+        ttl: Time to live in seconds
+
+    Returns:
+        Decorator wrapping the function with get_or_fetch semantics
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = make_key(namespace, func, args, kwargs)
+                cached_entry = _lookup(key)
+                if cached_entry is not None and cached_entry[0]:
+                    return cached_entry[1]
+                return _resolve(key, cached_entry, ttl, await func(*args, **kwargs))
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(namespace, func, args, kwargs)
+            return get_or_fetch(key, ttl, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def clear() -> None:
+    """Drop every cached entry."""
+    with _lock:
+        _entries.clear()
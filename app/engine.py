@@ -3,18 +3,78 @@ Google Play Store scraping engine.
 Handles all data fetching operations using gplay-scraper.
 """
 
+import asyncio
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from functools import partial
+from types import MappingProxyType
 from gplay_scraper import GPlayScraper
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Sequence, Any
 import logging
+from app.cache import cached, APP_INFO_TTL, REVIEWS_TTL
+from app.validators import validate_app_id  # noqa: F401  (re-exported)
+from app.multi_country import fetch_countries, fetch_countries_async
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Global scraper instance using curl_cffi for better reliability
 scraper = GPlayScraper(http_client="curl_cffi")
 
+# Pool size used when GPLAY_POOL_SIZE is unset or invalid
+_DEFAULT_POOL_SIZE = 8
 
+
+def _pool_size_from_env() -> int:
+    """Read GPLAY_POOL_SIZE, falling back to the default on invalid values."""
+    raw = os.getenv("GPLAY_POOL_SIZE", "").strip()
+    if not raw:
+        return _DEFAULT_POOL_SIZE
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning(
+            "Ignoring invalid GPLAY_POOL_SIZE=%r; using %s", raw, _DEFAULT_POOL_SIZE
+        )
+        return _DEFAULT_POOL_SIZE
+
+
+# Concurrent fetches (e.g. multi-country) each check out their own scraper
+# so no curl_cffi session is shared between threads. The pool grows lazily
+# up to GPLAY_POOL_SIZE instances; further callers wait for a free one.
+GPLAY_POOL_SIZE = _pool_size_from_env()
+_scraper_pool: "queue.LifoQueue[GPlayScraper]" = queue.LifoQueue()
+_scraper_pool.put(scraper)
+_scraper_slots = threading.BoundedSemaphore(GPLAY_POOL_SIZE)
+
+
+@contextmanager
+def _pooled_scraper():
+    """Check a GPlayScraper out of the pool for the duration of a call."""
+    with _scraper_slots:
+        try:
+            client = _scraper_pool.get_nowait()
+        except queue.Empty:
+            client = GPlayScraper(http_client="curl_cffi")
+        try:
+            yield client
+        finally:
+            _scraper_pool.put(client)
+
+
+# Map sort parameter to gplay-scraper format (uses uppercase strings)
+_SORT_MAPPING = MappingProxyType({
+    "newest": "NEWEST",
+    "rating": "RATING",
+    "helpfulness": "RELEVANT"
+})
+
+# Countries queried by fetch_reviews_multi_country when none are given
+_DEFAULT_GPLAY_COUNTRIES = ('us', 'kr', 'jp', 'gb', 'de', 'fr', 'in', 'br')
+
+
+@cached("gplay", APP_INFO_TTL)
 def fetch_app_info(
     app_id: str,
     lang: str = "en",
@@ -32,14 +92,15 @@ def fetch_app_info(
         Dictionary containing app information or error details
     """
     try:
-        logger.info(f"Fetching app info for: {app_id}")
+        logger.info("Fetching app info for: %s", app_id)
         
         # Fetch app details from Google Play Store using app_analyze method
-        result = scraper.app_analyze(
-            app_id=app_id,
-            lang=lang,
-            country=country
-        )
+        with _pooled_scraper() as client:
+            result = client.app_analyze(
+                app_id=app_id,
+                lang=lang,
+                country=country
+            )
         
         if not result:
             return {
@@ -71,7 +132,7 @@ def fetch_app_info(
             "url": result.get("url"),
         }
         
-        logger.info(f"Successfully fetched info for: {app_info['title']}")
+        logger.info("Successfully fetched info for: %s", app_info['title'])
         return app_info
         
     except Exception as e:
@@ -83,6 +144,7 @@ def fetch_app_info(
         }
 
 
+@cached("gplay", REVIEWS_TTL)
 def fetch_app_reviews(
     app_id: str,
     count: int = 100,
@@ -106,24 +168,19 @@ def fetch_app_reviews(
         List of dictionaries containing review data, or list with error dict
     """
     try:
-        logger.info(f"Fetching {count} reviews for: {app_id}")
+        logger.info("Fetching %s reviews for: %s", count, app_id)
         
-        # Map sort parameter to gplay-scraper format (uses uppercase strings)
-        sort_mapping = {
-            "newest": "NEWEST",
-            "rating": "RATING",
-            "helpfulness": "RELEVANT"
-        }
-        sort_value = sort_mapping.get(sort.lower(), "NEWEST")
+        sort_value = _SORT_MAPPING.get(sort.lower(), "NEWEST")
         
         # Fetch reviews from Google Play Store using reviews_analyze method
-        reviews_data = scraper.reviews_analyze(
-            app_id=app_id,
-            lang=lang,
-            country=country,
-            count=count,
-            sort=sort_value
-        )
+        with _pooled_scraper() as client:
+            reviews_data = client.reviews_analyze(
+                app_id=app_id,
+                lang=lang,
+                country=country,
+                count=count,
+                sort=sort_value
+            )
         
         if not reviews_data:
             return [{
@@ -155,7 +212,7 @@ def fetch_app_reviews(
             }
             reviews.append(review_info)
         
-        logger.info(f"Successfully fetched {len(reviews)} reviews" + (" (text only)" if text_only else ""))
+        logger.info("Successfully fetched %s reviews%s", len(reviews), " (text only)" if text_only else "")
         return reviews
         
     except Exception as e:
@@ -169,7 +226,7 @@ def fetch_app_reviews(
 
 def fetch_reviews_multi_country(
     app_id: str,
-    countries: List[str] = None,
+    countries: Sequence[str] = _DEFAULT_GPLAY_COUNTRIES,
     count_per_country: int = 100,
     lang: str = "en",
     sort: str = "newest",
@@ -180,7 +237,7 @@ def fetch_reviews_multi_country(
     
     Args:
         app_id: The app's package name
-        countries: List of country codes (default: ['us', 'kr', 'jp', 'gb', 'de', 'fr'])
+        countries: Country codes to fetch (default: ('us', 'kr', 'jp', 'gb', 'de', 'fr', 'in', 'br'))
         count_per_country: Number of reviews to fetch per country (default: 100)
         lang: Language code (default: 'en')
         sort: Sort order (default: 'newest')
@@ -189,67 +246,63 @@ def fetch_reviews_multi_country(
     Returns:
         Combined list of reviews from all countries (duplicates removed by review_id)
     """
-    if countries is None:
-        countries = ['us', 'kr', 'jp', 'gb', 'de', 'fr', 'in', 'br']
-    
-    all_reviews = []
-    seen_review_ids = set()
+    logger.info("Fetching reviews from %s countries for: %s", len(countries), app_id)
     
-    logger.info(f"Fetching reviews from {len(countries)} countries for: {app_id}")
+    all_reviews = fetch_countries(
+        fetch_app_reviews,
+        countries,
+        app_id=app_id,
+        count=count_per_country,
+        lang=lang,
+        sort=sort,
+        text_only=text_only
+    )
     
-    for country in countries:
-        try:
-            logger.info(f"Fetching from country: {country}")
-            reviews = fetch_app_reviews(
-                app_id=app_id,
-                count=count_per_country,
-                lang=lang,
-                country=country,
-                sort=sort,
-                text_only=text_only
-            )
-            
-            # Skip if error
-            if reviews and isinstance(reviews, list) and "error" in reviews[0]:
-                continue
-            
-            # Add unique reviews
-            for review in reviews:
-                review_id = review.get("review_id")
-                if review_id and review_id not in seen_review_ids:
-                    seen_review_ids.add(review_id)
-                    review["fetched_from_country"] = country
-                    all_reviews.append(review)
-        
-        except Exception as e:
-            logger.warning(f"Error fetching from {country}: {str(e)}")
-            continue
-    
-    logger.info(f"Total unique reviews fetched: {len(all_reviews)}")
+    logger.info("Total unique reviews fetched: %s", len(all_reviews))
     return all_reviews
 
 
-def validate_app_id(app_id: str) -> bool:
+async def fetch_reviews_multi_country_async(
+    app_id: str,
+    countries: Sequence[str] = _DEFAULT_GPLAY_COUNTRIES,
+    count_per_country: int = 100,
+    lang: str = "en",
+    sort: str = "newest",
+    text_only: bool = False
+) -> List[Dict[str, Any]]:
     """
-    Validate if an app ID is in the correct format.
+    Asynchronous variant of fetch_reviews_multi_country.
+    
+    gplay-scraper is synchronous, so each country's fetch runs in the event
+    loop's default executor and the calls are awaited together.
     
     Args:
-        app_id: The app's package name to validate
+        app_id: The app's package name
+        countries: Country codes to fetch (default: ('us', 'kr', 'jp', 'gb', 'de', 'fr', 'in', 'br'))
+        count_per_country: Number of reviews to fetch per country (default: 100)
+        lang: Language code (default: 'en')
+        sort: Sort order (default: 'newest')
+        text_only: If True, only return reviews with text/comments (default: False)
     
     Returns:
-        True if valid format, False otherwise
+        Combined list of reviews from all countries (duplicates removed by review_id)
     """
-    if not app_id or not isinstance(app_id, str):
-        return False
+    logger.info("Fetching reviews from %s countries for: %s", len(countries), app_id)
+    
+    loop = asyncio.get_running_loop()
     
-    # Basic validation: should contain at least one dot and only valid characters
-    parts = app_id.split(".")
-    if len(parts) < 2:
-        return False
+    async def fetch(**kwargs):
+        return await loop.run_in_executor(None, partial(fetch_app_reviews, **kwargs))
     
-    # Check if all parts contain valid characters (alphanumeric and underscore)
-    for part in parts:
-        if not part or not all(c.isalnum() or c == "_" for c in part):
-            return False
+    all_reviews = await fetch_countries_async(
+        fetch,
+        countries,
+        app_id=app_id,
+        count=count_per_country,
+        lang=lang,
+        sort=sort,
+        text_only=text_only
+    )
     
-    return True
+    logger.info("Total unique reviews fetched: %s", len(all_reviews))
+    return all_reviews
@@ -3,11 +3,16 @@ Data models for the application.
 Optional module for structured data representation.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Optional, List
 
+# Slotted instances drop the per-instance __dict__; dataclass(slots=True)
+# needs Python 3.10+, older interpreters fall back to regular dataclasses
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class AppInfo:
     """Represents basic app information from the store."""
     app_id: str
@@ -19,7 +24,7 @@ class AppInfo:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Review:
     """Represents a single app review."""
     review_id: str
@@ -0,0 +1,106 @@
+"""
+Multi-country helpers shared by the scraping engines.
+Fans a per-country review fetch out concurrently and merges the results
+into one list without duplicate reviews.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+Reviews = List[Dict[str, Any]]
+
+
+def merge_country_reviews(country_results: Iterable[Tuple[str, Reviews]]) -> Reviews:
+    """
+    Merge per-country review lists, keeping the first copy of each review_id.
+
+    Args:
+        country_results: (country, reviews) pairs in priority order
+
+    Returns:
+        Combined list of unique reviews tagged with 'fetched_from_country'
+    """
+    merged = {}
+    for country, reviews in country_results:
+        # Skip if error
+        if reviews and "error" in reviews[0]:
+            logger.warning("No reviews from %s", country)
+            continue
+
+        for review in reviews:
+            review_id = review.get("review_id")
+            if review_id and review_id not in merged:
+                review["fetched_from_country"] = country
+                merged[review_id] = review
+
+    return list(merged.values())
+
+
+def fetch_countries(
+    fetch: Callable[..., Reviews],
+    countries: Sequence[str],
+    **kwargs: Any
+) -> Reviews:
+    """
+    Call fetch once per country on a thread pool and merge the results.
+
+    Args:
+        fetch: Per-country review fetcher, called as fetch(country=c, **kwargs)
+        countries: Country codes in priority order
+        **kwargs: Remaining arguments for fetch
+
+    Returns:
+        Merged reviews (see merge_country_reviews)
+    """
+    # Country requests are independent and I/O-bound, so fan them out and
+    # merge once every country has finished
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(len(countries), 16))) as executor:
+        futures = {executor.submit(fetch, country=c, **kwargs): c for c in countries}
+
+        for future in as_completed(futures):
+            country = futures[future]
+            try:
+                results[country] = future.result()
+            except Exception as e:
+                logger.warning("Error fetching from %s: %s", country, e)
+
+    # Merge in the caller's country order so output doesn't depend on timing
+    return merge_country_reviews(
+        (country, results[country]) for country in countries if country in results
+    )
+
+
+async def fetch_countries_async(
+    fetch: Callable[..., Awaitable[Reviews]],
+    countries: Sequence[str],
+    **kwargs: Any
+) -> Reviews:
+    """
+    Asynchronous variant of fetch_countries awaiting every country together.
+
+    Args:
+        fetch: Async per-country review fetcher, called as fetch(country=c, **kwargs)
+        countries: Country codes in priority order
+        **kwargs: Remaining arguments for fetch
+
+    Returns:
+        Merged reviews (see merge_country_reviews)
+    """
+    results = await asyncio.gather(
+        *[fetch(country=c, **kwargs) for c in countries],
+        return_exceptions=True
+    )
+
+    country_results = []
+    for country, reviews in zip(countries, results):
+        if isinstance(reviews, Exception):
+            logger.warning("Error fetching from %s: %s", country, reviews)
+            continue
+        country_results.append((country, reviews))
+
+    return merge_country_reviews(country_results)
@@ -4,15 +4,43 @@ Provides a clean interface for fetching and viewing app information and reviews.
 """
 
 import customtkinter as ctk
-from tkinter import messagebox, filedialog
-import json
-from datetime import datetime
-from typing import Optional, Dict, Any
-from app import engine as playstore_engine
-from app import appstore_engine
-from app.engine import validate_app_id
-from app.appstore_engine import validate_app_name
-from deep_translator import GoogleTranslator
+import logging
+from tkinter import filedialog
+import orjson
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import time
+from functools import partial
+from typing import Optional, Dict, Any, Callable, Tuple
+from types import ModuleType
+from app.validators import validate_app_id, validate_app_name
+
+# Maximum number of characters rendered in the output text box
+MAX_DISPLAY_CHARS = 200_000
+
+# Characters inserted into the output text box per idle callback
+OUTPUT_CHUNK_CHARS = 65_536
+
+
+def _load_engine(platform: str) -> ModuleType:
+    """
+    Import the scraping engine for a platform on first use.
+    
+    The engines pull in httpx and gplay_scraper, so they are loaded only when
+    a crawl is started instead of at window startup.
+    
+    Args:
+        platform: 'Google Play' or 'App Store'
+    
+    Returns:
+        The engine module for the platform
+    """
+    if platform == "Google Play":
+        from app import engine
+        return engine
+    from app import appstore_engine
+    return appstore_engine
 
 
 class AppScraperGUI:
@@ -28,11 +56,35 @@ class AppScraperGUI:
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
         
+        # Shared fonts, created once and reused by every widget
+        self._font_title = ctk.CTkFont(size=24, weight="bold")
+        self._font_bold = ctk.CTkFont(size=14, weight="bold")  # buttons and section labels
+        self._font_status = ctk.CTkFont(size=12)
+        self._font_mono = ctk.CTkFont(family="Monaco", size=12)
+        
         # Store current data for export
         self.current_data: Optional[Any] = None
         self.data_type: Optional[str] = None  # 'app_info' or 'reviews'
         
+        # Rendered JSON of current_data keyed by (id(current_data), output format);
+        # reset whenever current_data is replaced
+        self._json_cache: Dict[Tuple[int, str], str] = {}
+        
+        # Fetches run on worker threads; results come back through the queue
+        # and are drained on the Tk thread by _poll_results
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        
+        # Set when the window closes; long worker jobs (translation) check it
+        # so the process doesn't outlive the window by minutes
+        self._cancel = threading.Event()
+        self._result_q: "queue.Queue[Tuple[str, Optional[Dict[str, Any]], Any]]" = queue.Queue()
+        
+        # Bumped on every _update_output so pending chunk inserts for older
+        # text stop once newer text replaces it
+        self._output_gen = 0
+        
         self._setup_ui()
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
     
     def _setup_ui(self):
         """Set up the user interface components."""
@@ -44,7 +96,7 @@ class AppScraperGUI:
         title_label = ctk.CTkLabel(
             main_frame,
             text="🛍️ App Store Review Scraper",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self._font_title
         )
         title_label.pack(pady=(0, 20))
         
@@ -56,167 +108,122 @@ class AppScraperGUI:
         
         # Output section
         self._create_output_section(main_frame)
+        
+        # Start draining worker results
+        self.window.after(50, self._poll_results)
     
     def _create_input_section(self, parent):
-        """Create the input fields section."""
+        """Create the input fields section.
+        
+        All rows share one grid on input_frame: column 0 holds the row
+        labels, columns 1-3 the inputs, and column 4 absorbs extra width.
+        """
         input_frame = ctk.CTkFrame(parent)
         input_frame.pack(fill="x", padx=10, pady=(0, 10))
+        input_frame.grid_columnconfigure(4, weight=1)
         
-        # Platform selection
-        platform_frame = ctk.CTkFrame(input_frame)
-        platform_frame.pack(fill="x", padx=10, pady=5)
+        row_label = {"width": 120, "anchor": "w"}
+        label_pad = {"padx": (10, 10), "pady": 5, "sticky": "w"}
         
-        ctk.CTkLabel(
-            platform_frame,
-            text="Platform:",
-            width=120,
-            anchor="w"
-        ).pack(side="left", padx=(0, 10))
+        # Platform selection
+        ctk.CTkLabel(input_frame, text="Platform:", **row_label).grid(row=0, column=0, **label_pad)
         
         self.platform_var = ctk.StringVar(value="Google Play")
         self.platform_menu = ctk.CTkSegmentedButton(
-            platform_frame,
+            input_frame,
             variable=self.platform_var,
             values=["Google Play", "App Store"],
             command=self._on_platform_change
         )
-        self.platform_menu.pack(side="left", fill="x", expand=True)
+        self.platform_menu.grid(row=0, column=1, columnspan=4, padx=(0, 10), pady=5, sticky="ew")
         
         # App ID / App Name
-        app_id_frame = ctk.CTkFrame(input_frame)
-        app_id_frame.pack(fill="x", padx=10, pady=5)
-        
-        self.app_id_label = ctk.CTkLabel(
-            app_id_frame,
-            text="App ID:",
-            width=120,
-            anchor="w"
-        )
-        self.app_id_label.pack(side="left", padx=(0, 10))
+        self.app_id_label = ctk.CTkLabel(input_frame, text="App ID:", **row_label)
+        self.app_id_label.grid(row=1, column=0, **label_pad)
         
         self.app_id_entry = ctk.CTkEntry(
-            app_id_frame,
+            input_frame,
             placeholder_text="e.g., com.instagram.android"
         )
-        self.app_id_entry.pack(side="left", fill="x", expand=True)
+        self.app_id_entry.grid(row=1, column=1, columnspan=4, padx=(0, 10), pady=5, sticky="ew")
         
         # Language and Country on same row
-        lang_country_frame = ctk.CTkFrame(input_frame)
-        lang_country_frame.pack(fill="x", padx=10, pady=5)
-        
-        # Language
-        ctk.CTkLabel(
-            lang_country_frame,
-            text="Language:",
-            width=120,
-            anchor="w"
-        ).pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(input_frame, text="Language:", **row_label).grid(row=2, column=0, **label_pad)
         
         self.lang_entry = ctk.CTkEntry(
-            lang_country_frame,
+            input_frame,
             width=100,
             placeholder_text="en"
         )
         self.lang_entry.insert(0, "en")
-        self.lang_entry.pack(side="left", padx=(0, 20))
+        self.lang_entry.grid(row=2, column=1, padx=(0, 20), pady=5, sticky="w")
         
-        # Country
-        ctk.CTkLabel(
-            lang_country_frame,
-            text="Country:",
-            width=80,
-            anchor="w"
-        ).pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(input_frame, text="Country:", width=80, anchor="w").grid(
+            row=2, column=2, padx=(0, 10), pady=5, sticky="w"
+        )
         
         self.country_entry = ctk.CTkEntry(
-            lang_country_frame,
+            input_frame,
             width=100,
             placeholder_text="us"
         )
         self.country_entry.insert(0, "us")
-        self.country_entry.pack(side="left")
+        self.country_entry.grid(row=2, column=3, pady=5, sticky="w")
         
         # Review count and sort
-        review_frame = ctk.CTkFrame(input_frame)
-        review_frame.pack(fill="x", padx=10, pady=5)
-        
-        ctk.CTkLabel(
-            review_frame,
-            text="Review Count:",
-            width=120,
-            anchor="w"
-        ).pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(input_frame, text="Review Count:", **row_label).grid(row=3, column=0, **label_pad)
         
         self.count_entry = ctk.CTkEntry(
-            review_frame,
+            input_frame,
             width=100,
             placeholder_text="100"
         )
         self.count_entry.insert(0, "100")
-        self.count_entry.pack(side="left", padx=(0, 20))
+        self.count_entry.grid(row=3, column=1, padx=(0, 20), pady=5, sticky="w")
         
-        ctk.CTkLabel(
-            review_frame,
-            text="Sort By:",
-            width=80,
-            anchor="w"
-        ).pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(input_frame, text="Sort By:", width=80, anchor="w").grid(
+            row=3, column=2, padx=(0, 10), pady=5, sticky="w"
+        )
         
         self.sort_var = ctk.StringVar(value="newest")
         self.sort_menu = ctk.CTkOptionMenu(
-            review_frame,
+            input_frame,
             variable=self.sort_var,
             values=["newest", "rating", "helpfulness"],
             width=150
         )
-        self.sort_menu.pack(side="left")
+        self.sort_menu.grid(row=3, column=3, pady=5, sticky="w")
         
         # Text-only filter checkbox
-        filter_frame = ctk.CTkFrame(input_frame)
-        filter_frame.pack(fill="x", padx=10, pady=5)
-        
-        ctk.CTkLabel(
-            filter_frame,
-            text="Filters:",
-            width=120,
-            anchor="w"
-        ).pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(input_frame, text="Filters:", **row_label).grid(row=4, column=0, **label_pad)
         
         self.text_only_var = ctk.BooleanVar(value=False)
         self.text_only_checkbox = ctk.CTkCheckBox(
-            filter_frame,
+            input_frame,
             text="Only reviews with text/description",
             variable=self.text_only_var
         )
-        self.text_only_checkbox.pack(side="left", padx=(0, 20))
+        self.text_only_checkbox.grid(row=4, column=1, columnspan=3, padx=(0, 20), pady=5, sticky="w")
         
         self.translate_var = ctk.BooleanVar(value=False)
         self.translate_checkbox = ctk.CTkCheckBox(
-            filter_frame,
+            input_frame,
             text="Translate to English",
             variable=self.translate_var
         )
-        self.translate_checkbox.pack(side="left")
+        self.translate_checkbox.grid(row=4, column=4, pady=5, sticky="w")
         
         # Output format selection
-        output_frame = ctk.CTkFrame(input_frame)
-        output_frame.pack(fill="x", padx=10, pady=5)
-        
-        ctk.CTkLabel(
-            output_frame,
-            text="Output Format:",
-            width=120,
-            anchor="w"
-        ).pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(input_frame, text="Output Format:", **row_label).grid(row=5, column=0, **label_pad)
         
         self.output_format_var = ctk.StringVar(value="Full")
         self.output_format_menu = ctk.CTkOptionMenu(
-            output_frame,
+            input_frame,
             variable=self.output_format_var,
             values=["Full", "Text only", "Title + Text"],
             width=150
         )
-        self.output_format_menu.pack(side="left")
+        self.output_format_menu.grid(row=5, column=1, columnspan=3, pady=5, sticky="w")
     
     def _create_button_section(self, parent):
         """Create the action buttons section."""
@@ -231,7 +238,7 @@ class AppScraperGUI:
             row1,
             text="📱 Crawl App Info",
             command=self._crawl_app_info,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font_bold,
             height=40
         )
         self.app_info_btn.pack(side="left", padx=5, expand=True, fill="x")
@@ -240,7 +247,7 @@ class AppScraperGUI:
             row1,
             text="⭐ Crawl Reviews",
             command=self._crawl_reviews,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font_bold,
             height=40
         )
         self.reviews_btn.pack(side="left", padx=5, expand=True, fill="x")
@@ -249,7 +256,7 @@ class AppScraperGUI:
             row1,
             text="🌍 Multi-Country Reviews",
             command=self._crawl_reviews_multi_country,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font_bold,
             height=40,
             fg_color="purple",
             hover_color="darkviolet"
@@ -264,7 +271,7 @@ class AppScraperGUI:
             row2,
             text="💾 Export JSON",
             command=self._export_json,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font_bold,
             height=40,
             fg_color="green",
             hover_color="darkgreen"
@@ -275,12 +282,21 @@ class AppScraperGUI:
             row2,
             text="🗑️ Clear",
             command=self._clear_output,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font_bold,
             height=40,
             fg_color="gray",
             hover_color="darkgray"
         )
         self.clear_btn.pack(side="left", padx=5, expand=True, fill="x")
+        
+        # Toggled together while a crawl is running
+        self._all_buttons = (
+            self.app_info_btn,
+            self.reviews_btn,
+            self.multi_country_btn,
+            self.export_btn,
+            self.clear_btn
+        )
     
     def _on_platform_change(self, value):
         """Handle platform selection change."""
@@ -304,7 +320,7 @@ class AppScraperGUI:
         ctk.CTkLabel(
             output_frame,
             text="Results:",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font_bold,
             anchor="w"
         ).pack(fill="x", padx=10, pady=(10, 5))
         
@@ -312,16 +328,20 @@ class AppScraperGUI:
         self.status_label = ctk.CTkLabel(
             output_frame,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=self._font_status,
             anchor="w",
             wraplength=950
         )
         self.status_label.pack(fill="x", padx=10, pady=(0, 5))
         
+        # Indeterminate progress bar, packed above the text box only while
+        # a crawl is running
+        self.progress_bar = ctk.CTkProgressBar(output_frame, mode="indeterminate")
+        
         # Text box with scrollbar
         self.output_text = ctk.CTkTextbox(
             output_frame,
-            font=ctk.CTkFont(family="Monaco", size=12),
+            font=self._font_mono,
             wrap="word"
         )
         self.output_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
@@ -354,236 +374,235 @@ class AppScraperGUI:
             "translate": self.translate_var.get()
         }
     
-    def _validate_inputs(self, inputs: Dict[str, Any]) -> bool:
-        """Validate input values."""
+    def _validate_inputs(self, inputs: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """Validate input values.
+        
+        Returns:
+            Tuple of (whether the crawl can proceed, message to show or None).
+            A message with True is a warning about a suspicious value.
+        """
         platform = inputs.get("platform", "Google Play")
         
         if not inputs["app_id"]:
             field_name = "App Name or ID" if platform == "App Store" else "App ID"
-            messagebox.showerror("Error", f"Please enter an {field_name}")
-            return False
+            return False, f"Please enter an {field_name}"
         
         # Validate based on platform
         if platform == "Google Play":
             if not validate_app_id(inputs["app_id"]):
-                messagebox.showwarning(
-                    "Warning",
-                    "App ID format may be invalid. Expected format: com.company.app"
-                )
+                return True, "App ID format may be invalid. Expected format: com.company.app"
         else:  # App Store
             # For App Store, accept either numeric ID or app name
             # Numeric IDs are preferred and always valid
             if not inputs["app_id"].isdigit():
                 # If not numeric, validate as app name
                 if not validate_app_name(inputs["app_id"]):
-                    messagebox.showwarning(
-                        "Warning",
-                        "Please enter a valid app name or numeric app ID (recommended)."
-                    )
+                    return True, "Please enter a valid app name or numeric app ID (recommended)."
         
-        return True
+        return True, None
+    
+    def _check_inputs(self, inputs: Dict[str, Any]) -> bool:
+        """Validate inputs, reporting problems on the status label.
+        
+        Inline status is used instead of a modal dialog so invalid input
+        never blocks the event loop.
+        
+        Returns:
+            True if the crawl can proceed
+        """
+        ok, message = self._validate_inputs(inputs)
+        if message:
+            if ok:
+                self._show_status(f"⚠️ {message}", "warning")
+            else:
+                self._show_status(f"❌ {message}", "error")
+        else:
+            # Don't leave the previous crawl's result up while this one runs
+            self._show_status("⏳ Fetching...", "normal")
+        return ok
     
     def _crawl_app_info(self):
         """Crawl and display app information."""
         inputs = self._get_input_values()
         
-        if not self._validate_inputs(inputs):
+        if not self._check_inputs(inputs):
             return
         
-        # Disable buttons during operation
-        self._set_buttons_state("disabled")
         self._update_output("Fetching app information...\n")
-        self.window.update()
         
-        try:
-            # Select the appropriate engine
-            platform = inputs.get("platform", "Google Play")
-            
-            if platform == "Google Play":
-                result = playstore_engine.fetch_app_info(
-                    app_id=inputs["app_id"],
-                    lang=inputs["lang"],
-                    country=inputs["country"]
-                )
-                title_key = "title"
-            else:  # App Store
-                result = appstore_engine.fetch_app_info(
-                    app_name=inputs["app_id"],
-                    country=inputs["country"]
-                )
-                title_key = "app_name"
-            
-            # Check for errors
-            if "error" in result:
-                error_msg = result["error"]
-                if "suggestion" in result:
-                    error_msg += f" {result['suggestion']}"
-                self._show_status(f"❌ Error: {error_msg}", "error")
-                self._update_output(json.dumps(result, indent=2, ensure_ascii=False))
-            else:
-                # Store data for export
-                self.current_data = result
-                self.data_type = "app_info"
-                
-                # Display formatted JSON
-                json_str = json.dumps(result, indent=2, ensure_ascii=False)
-                self._update_output(json_str)
-                
-                title = result.get(title_key, result.get("title", "N/A"))
-                self._show_status(f"✅ Successfully fetched info for: {title}", "success")
+        # Select the appropriate engine
+        platform = inputs.get("platform", "Google Play")
+        engine = _load_engine(platform)
         
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            self._show_status(f"❌ {error_msg}", "error")
-            self._update_output(error_msg + "\n")
+        if platform == "Google Play":
+            job = partial(
+                engine.fetch_app_info,
+                app_id=inputs["app_id"],
+                lang=inputs["lang"],
+                country=inputs["country"]
+            )
+        else:  # App Store
+            job = partial(
+                engine.fetch_app_info,
+                app_name=inputs["app_id"],
+                country=inputs["country"]
+            )
         
-        finally:
-            self._set_buttons_state("normal")
+        self._start_crawl("app_info", job, inputs)
     
     def _crawl_reviews(self):
         """Crawl and display app reviews."""
         inputs = self._get_input_values()
         
-        if not self._validate_inputs(inputs):
+        if not self._check_inputs(inputs):
             return
         
-        # Disable buttons during operation
-        self._set_buttons_state("disabled")
-        self._update_output(f"Fetching reviews...\n")
-        self.window.update()
+        self._update_output("Fetching reviews...\n")
         
-        try:
-            # Select the appropriate engine
-            platform = inputs.get("platform", "Google Play")
-            
-            if platform == "Google Play":
-                result = playstore_engine.fetch_app_reviews(
-                    app_id=inputs["app_id"],
-                    count=inputs["count"],
-                    lang=inputs["lang"],
-                    country=inputs["country"],
-                    sort=inputs["sort"],
-                    text_only=inputs["text_only"]
-                )
-            else:  # App Store
-                result = appstore_engine.fetch_app_reviews(
-                    app_name=inputs["app_id"],
-                    country=inputs["country"],
-                    count=inputs["count"],
-                    sort="mostRecent" if inputs["sort"] == "newest" else "mostHelpful",
-                    text_only=inputs["text_only"]
-                )
-            
-            # Check for errors
-            if result and isinstance(result, list) and "error" in result[0]:
-                error_msg = result[0]["error"]
-                if "suggestion" in result[0]:
-                    error_msg += f" {result[0]['suggestion']}"
-                self._show_status(f"❌ Error: {error_msg}", "error")
-                self._update_output(json.dumps(result, indent=2, ensure_ascii=False))
-            else:
-                # Store data for export
-                self.current_data = result
-                self.data_type = "reviews"
-                
-                # Apply translation if requested
-                if inputs["translate"]:
-                    self._show_status("🔄 Translating reviews to English...", "warning")
-                    self.window.update()
-                    result = self._translate_reviews(result)
-                
-                # Apply output formatting
-                output_format = self.output_format_var.get()
-                formatted_result = self._format_output(result, output_format)
-                
-                # Display formatted JSON
-                json_str = json.dumps(formatted_result, indent=2, ensure_ascii=False)
-                self._update_output(json_str)
-                
-                # Create informative message
-                actual_count = len(result)
-                requested_count = inputs["count"]
-                text_only_note = " (text only)" if inputs["text_only"] else ""
-                translate_note = " (translated)" if inputs["translate"] else ""
-                
-                message = f"✅ Successfully fetched {actual_count} reviews{text_only_note}{translate_note}"
-                if actual_count < requested_count:
-                    message += f" (requested {requested_count}). Try multi-country for more reviews."
-                
-                self._show_status(message, "success")
-        
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            self._show_status(f"❌ {error_msg}", "error")
-            self._update_output(error_msg + "\n")
+        # Select the appropriate engine
+        platform = inputs.get("platform", "Google Play")
+        engine = _load_engine(platform)
         
-        finally:
-            self._set_buttons_state("normal")
+        if platform == "Google Play":
+            fetch = partial(
+                engine.fetch_app_reviews,
+                app_id=inputs["app_id"],
+                count=inputs["count"],
+                lang=inputs["lang"],
+                country=inputs["country"],
+                sort=inputs["sort"],
+                text_only=inputs["text_only"]
+            )
+        else:  # App Store
+            fetch = partial(
+                engine.fetch_app_reviews,
+                app_name=inputs["app_id"],
+                country=inputs["country"],
+                count=inputs["count"],
+                sort="mostRecent" if inputs["sort"] == "newest" else "mostHelpful",
+                text_only=inputs["text_only"]
+            )
+        
+        self._start_crawl("reviews", partial(self._fetch_reviews_job, fetch, inputs["translate"]), inputs)
     
     def _crawl_reviews_multi_country(self):
         """Crawl reviews from multiple countries to get more comprehensive data."""
         inputs = self._get_input_values()
         
-        if not self._validate_inputs(inputs):
+        if not self._check_inputs(inputs):
             return
         
-        # Disable buttons during operation
-        self._set_buttons_state("disabled")
         self._update_output("Fetching reviews from multiple countries...\nThis may take a while...\n")
-        self.window.update()
         
-        try:
-            # Select the appropriate engine
-            platform = inputs.get("platform", "Google Play")
+        # Select the appropriate engine
+        platform = inputs.get("platform", "Google Play")
+        engine = _load_engine(platform)
+        
+        if platform == "Google Play":
+            # gplay-scraper is synchronous; the engine fans countries out on threads
+            fetch = partial(
+                engine.fetch_reviews_multi_country,
+                app_id=inputs["app_id"],
+                count_per_country=inputs["count"],
+                lang=inputs["lang"],
+                sort=inputs["sort"],
+                text_only=inputs["text_only"]
+            )
+        else:  # App Store
+            # Countries and pages are fetched concurrently on an event loop
+            # in the worker, sharing one HTTP/2 connection
+            from app.async_client import run_in_new_loop
             
-            if platform == "Google Play":
-                result = playstore_engine.fetch_reviews_multi_country(
-                    app_id=inputs["app_id"],
-                    count_per_country=inputs["count"],
-                    lang=inputs["lang"],
-                    sort=inputs["sort"],
-                    text_only=inputs["text_only"]
-                )
-            else:  # App Store
-                result = appstore_engine.fetch_reviews_multi_country(
+            fetch = partial(
+                run_in_new_loop,
+                partial(
+                    engine.fetch_reviews_multi_country_async,
                     app_name=inputs["app_id"],
                     count_per_country=inputs["count"],
                     sort="mostRecent" if inputs["sort"] == "newest" else "mostHelpful",
                     text_only=inputs["text_only"]
                 )
-            
-            # Check if we got results
-            if not result or (isinstance(result, list) and "error" in result[0]):
-                error = result[0]["error"] if result else "No reviews found"
-                self._show_status(f"❌ Error: {error}", "error")
-                self._update_output(f"Error: {error}\n")
-            else:
-                # Store data for export
-                self.current_data = result
-                self.data_type = "reviews_multi_country"
-                
-                # Apply translation if requested
-                if inputs["translate"]:
-                    self._show_status("🔄 Translating reviews to English...", "warning")
-                    self.window.update()
-                    result = self._translate_reviews(result)
-                
-                # Apply output formatting
-                output_format = self.output_format_var.get()
-                formatted_result = self._format_output(result, output_format)
-                
-                # Display formatted JSON
-                json_str = json.dumps(formatted_result, indent=2, ensure_ascii=False)
-                self._update_output(json_str)
-                
-                text_only_note = " (text only)" if inputs["text_only"] else ""
-                translate_note = " (translated)" if inputs["translate"] else ""
-                # Show success message
-                self._show_status(
-                    f"✅ Successfully fetched {len(result)} unique reviews{text_only_note}{translate_note} from multiple countries! "
-                    f"Each review has a 'fetched_from_country' field.",
-                    "success"
-                )
+            )
+        
+        self._start_crawl(
+            "reviews_multi_country",
+            partial(self._fetch_reviews_job, fetch, inputs["translate"]),
+            inputs
+        )
+    
+    def _fetch_reviews_job(self, fetch: Callable[[], Any], translate: bool) -> Tuple[Any, Any]:
+        """Fetch reviews and optionally translate them. Runs on a worker thread.
+        
+        Args:
+            fetch: Zero-argument callable returning the engine result
+            translate: Whether to translate the reviews to English
+        
+        Returns:
+            Tuple of (raw result for export, result to display)
+        """
+        result = fetch()
+        
+        if self._cancel.is_set():
+            return result, result
+        
+        if translate and result and isinstance(result, list) and "error" not in result[0]:
+            self._result_q.put(("status", None, ("🔄 Translating reviews to English...", "warning")))
+            return result, self._translate_reviews(result)
+        
+        return result, result
+    
+    def _start_crawl(self, kind: str, job: Callable[[], Any], inputs: Dict[str, Any]):
+        """Run a crawl job on the worker pool without blocking the UI.
+        
+        Args:
+            kind: Result kind passed back to _on_result
+            job: Zero-argument callable performing the fetch
+            inputs: Form values the crawl was started with
+        """
+        # Disable buttons and show progress during operation
+        self._set_busy(True)
+        self._json_cache.clear()
+        
+        def work():
+            try:
+                self._result_q.put((kind, inputs, job()))
+            except Exception as e:
+                self._result_q.put(("exception", inputs, e))
+        
+        self._executor.submit(work)
+    
+    def _poll_results(self):
+        """Drain finished worker results on the Tk thread, then reschedule."""
+        try:
+            while True:
+                kind, inputs, result = self._result_q.get_nowait()
+                self._on_result(kind, inputs, result)
+        except queue.Empty:
+            pass
+        
+        self.window.after(50, self._poll_results)
+    
+    def _on_result(self, kind: str, inputs: Optional[Dict[str, Any]], result: Any):
+        """Display a result produced by a worker thread.
+        
+        Args:
+            kind: 'status', 'exception', 'app_info', 'reviews' or 'reviews_multi_country'
+            inputs: Form values the crawl was started with (None for 'status')
+            result: The worker's payload for this kind
+        """
+        if kind == "status":
+            self._show_status(*result)
+            return
+        
+        try:
+            if kind == "exception":
+                raise result
+            elif kind == "app_info":
+                self._show_app_info(inputs, result)
+            elif kind == "reviews":
+                self._show_reviews(inputs, *result)
+            else:  # reviews_multi_country
+                self._show_multi_country_reviews(inputs, *result)
         
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
@@ -591,7 +610,91 @@ class AppScraperGUI:
             self._update_output(error_msg + "\n")
         
         finally:
-            self._set_buttons_state("normal")
+            self._set_busy(False)
+    
+    def _show_app_info(self, inputs: Dict[str, Any], result: Dict[str, Any]):
+        """Display fetched app information."""
+        title_key = "title" if inputs.get("platform", "Google Play") == "Google Play" else "app_name"
+        
+        # Check for errors
+        if "error" in result:
+            error_msg = result["error"]
+            if "suggestion" in result:
+                error_msg += f" {result['suggestion']}"
+            self._show_status(f"❌ Error: {error_msg}", "error")
+            self._update_output(self._to_json(result))
+        else:
+            # Store data for export
+            self.current_data = result
+            self.data_type = "app_info"
+            
+            # Display formatted JSON
+            json_str = self._to_json(result)
+            self._update_output(json_str)
+            
+            title = result.get(title_key, result.get("title", "N/A"))
+            self._show_status(f"✅ Successfully fetched info for: {title}", "success")
+    
+    def _show_reviews(self, inputs: Dict[str, Any], result: Any, display_result: Any):
+        """Display fetched reviews."""
+        # Check for errors
+        if result and isinstance(result, list) and "error" in result[0]:
+            error_msg = result[0]["error"]
+            if "suggestion" in result[0]:
+                error_msg += f" {result[0]['suggestion']}"
+            self._show_status(f"❌ Error: {error_msg}", "error")
+            self._update_output(self._to_json(result))
+        else:
+            # Store data for export
+            self.current_data = result
+            self.data_type = "reviews"
+            
+            # Apply output formatting
+            output_format = self.output_format_var.get()
+            formatted_result = self._format_output(display_result, output_format)
+            
+            # Display as plain text or JSON depending on the format
+            self._update_output(self._render_reviews(formatted_result, output_format))
+            
+            # Create informative message
+            actual_count = len(result)
+            requested_count = inputs["count"]
+            text_only_note = " (text only)" if inputs["text_only"] else ""
+            translate_note = " (translated)" if inputs["translate"] else ""
+            
+            message = f"✅ Successfully fetched {actual_count} reviews{text_only_note}{translate_note}"
+            if actual_count < requested_count:
+                message += f" (requested {requested_count}). Try multi-country for more reviews."
+            
+            self._show_status(message, "success")
+    
+    def _show_multi_country_reviews(self, inputs: Dict[str, Any], result: Any, display_result: Any):
+        """Display reviews fetched from multiple countries."""
+        # Check if we got results
+        if not result or (isinstance(result, list) and "error" in result[0]):
+            error = result[0]["error"] if result else "No reviews found"
+            self._show_status(f"❌ Error: {error}", "error")
+            self._update_output(f"Error: {error}\n")
+        else:
+            # Store data for export
+            self.current_data = result
+            self.data_type = "reviews_multi_country"
+            
+            # Apply output formatting
+            output_format = self.output_format_var.get()
+            formatted_result = self._format_output(display_result, output_format)
+            
+            # Display as plain text or JSON depending on the format
+            self._update_output(self._render_reviews(formatted_result, output_format))
+            
+            text_only_note = " (text only)" if inputs["text_only"] else ""
+            translate_note = " (translated)" if inputs["translate"] else ""
+            # Show success message
+            self._show_status(
+                f"✅ Successfully fetched {len(result)} unique reviews{text_only_note}{translate_note} from multiple countries! "
+                f"Each review has a 'fetched_from_country' field.",
+                "success"
+            )
     
     def _export_json(self):
         """Export current data to JSON file."""
@@ -600,7 +703,7 @@ class AppScraperGUI:
             return
         
         # Generate default filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         default_filename = f"{self.data_type}_{timestamp}.json"
         
         # Open file dialog
@@ -615,8 +718,14 @@ class AppScraperGUI:
             return
         
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(self.current_data, f, indent=2, ensure_ascii=False)
+            # Reuse the JSON already rendered for display if there is one;
+            # otherwise write orjson's UTF-8 bytes directly
+            json_str = self._json_cache.get((id(self.current_data), "Full"))
+            with open(filepath, "wb") as f:
+                if json_str is not None:
+                    f.write(json_str.encode())
+                else:
+                    f.write(orjson.dumps(self.current_data, option=orjson.OPT_INDENT_2))
             
             self._show_status(f"✅ Data exported successfully to: {filepath}", "success")
         
@@ -629,11 +738,82 @@ class AppScraperGUI:
         self._show_status("", "normal")
         self.current_data = None
         self.data_type = None
+        self._json_cache.clear()
     
     def _update_output(self, text: str):
-        """Update the output text box."""
+        """Update the output text box.
+        
+        Text longer than MAX_DISPLAY_CHARS is cut off, since Tk text widgets
+        slow down badly on very large contents. The full data stays in
+        current_data for export.
+        """
+        if len(text) > MAX_DISPLAY_CHARS:
+            hidden = len(text) - MAX_DISPLAY_CHARS
+            text = (
+                text[:MAX_DISPLAY_CHARS]
+                + f"\n… truncated {hidden:,} chars — use Export JSON for full data"
+            )
+        
+        self._output_gen += 1
         self.output_text.delete("1.0", "end")
-        self.output_text.insert("1.0", text)
+        self._append_chunks(text, 0, self._output_gen)
+    
+    def _append_chunks(self, text: str, start: int, gen: int):
+        """Insert text into the output box one chunk per idle callback.
+        
+        Large outputs are split so the main loop can repaint and handle
+        scrolling between inserts instead of blocking on one huge insert.
+        """
+        if gen != self._output_gen:
+            return
+        
+        end = start + OUTPUT_CHUNK_CHARS
+        self.output_text.insert("end", text[start:end])
+        if end < len(text):
+            self.window.after_idle(self._append_chunks, text, end, gen)
+    
+    def _to_json(self, data: Any, output_format: str = "Full") -> str:
+        """Serialize data as indented JSON for display.
+        
+        The rendering of current_data is memoized per output format, so
+        showing it again or exporting it does not re-serialize.
+        """
+        if data is not self.current_data:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        
+        key = (id(data), output_format)
+        json_str = self._json_cache.get(key)
+        if json_str is None:
+            json_str = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            self._json_cache[key] = json_str
+        return json_str
+    
+    def _render_reviews(self, data: Any, output_format: str) -> str:
+        """Render formatted reviews for display.
+        
+        "Text only" and "Title + Text" are shown as plain text separated by
+        '---' lines; everything else (including errors) as indented JSON.
+        
+        Args:
+            data: Output of _format_output
+            output_format: "Full", "Text only", or "Title + Text"
+        
+        Returns:
+            Text for the output box
+        """
+        # "Text only" output is already rendered by _format_output
+        if isinstance(data, str):
+            return data
+        
+        if not isinstance(data, list) or not data or "error" in data[0]:
+            return self._to_json(data)
+        
+        if output_format == "Title + Text":
+            return "\n---\n".join(
+                f"{review.get('title') or ''}\n{review.get('text') or ''}" for review in data
+            )
+        else:  # Full
+            return self._to_json(data, output_format)
     
     def _format_output(self, data: Any, output_format: str) -> Any:
         """Format the output data based on selected format.
@@ -643,33 +823,29 @@ class AppScraperGUI:
             output_format: "Full", "Text only", or "Title + Text"
         
         Returns:
-            Formatted data
+            Formatted data; for "Text only" the display string itself
         """
-        # If it's app info or error, return as-is
-        if isinstance(data, dict):
+        # "Full" (the default), empty results and app info pass through as-is
+        if output_format == "Full" or not data or isinstance(data, dict):
             return data
         
-        # If it's not a list of reviews, return as-is
-        if not isinstance(data, list) or not data:
+        # Anything other than a list of reviews, or an error list, too
+        if not isinstance(data, list) or "error" in data[0]:
             return data
         
-        # Check if first item is an error
-        if "error" in data[0]:
-            return data
-        
-        # Apply formatting based on selection
+        # Apply formatting based on selection; dict.get is bound to a local
+        # so the per-review lookup skips the method resolution
+        get = dict.get
         if output_format == "Text only":
-            return [{"text": review.get("text", "")} for review in data]
+            # Join straight into the display text instead of building one
+            # single-key dict per review first
+            return "\n---\n".join(get(review, "text") or "" for review in data)
         elif output_format == "Title + Text":
             return [
-                {
-                    "title": review.get("title", ""),
-                    "text": review.get("text", "")
-                }
+                {"title": get(review, "title", ""), "text": get(review, "text", "")}
                 for review in data
             ]
-        else:  # Full
-            return data
+        return data
     
     def _translate_reviews(self, data: Any) -> Any:
         """Translate review text and titles to English.
@@ -688,10 +864,18 @@ class AppScraperGUI:
         if "error" in data[0]:
             return data
         
+        # Imported here (on the worker thread) since deep_translator pulls in
+        # requests and bs4, which would otherwise slow down window startup
+        from deep_translator import GoogleTranslator
+        
         translator = GoogleTranslator(source='auto', target='en')
         translated_data = []
         
         for review in data:
+            # One HTTP call per review; stop early if the window was closed
+            if self._cancel.is_set():
+                return data
+            
             translated_review = review.copy()
             
             try:
@@ -729,26 +913,39 @@ class AppScraperGUI:
         else:
             self.status_label.configure(text_color="#9ca3af")  # gray
     
+    def _set_busy(self, busy: bool):
+        """Toggle the buttons and the progress bar for a running crawl."""
+        if busy:
+            self.progress_bar.pack(fill="x", padx=10, pady=(0, 5), before=self.output_text)
+            self.progress_bar.start()
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.pack_forget()
+        self._set_buttons_state("disabled" if busy else "normal")
+    
     def _set_buttons_state(self, state: str):
         """Enable or disable all buttons."""
-        buttons = [
-            self.app_info_btn,
-            self.reviews_btn,
-            self.multi_country_btn,
-            self.export_btn,
-            self.clear_btn
-        ]
-        
-        for btn in buttons:
+        for btn in self._all_buttons:
             btn.configure(state=state)
     
     def run(self):
         """Start the GUI application."""
         self.window.mainloop()
+    
+    def _on_close(self):
+        """Stop pending work and close the window.
+        
+        Worker threads are not daemons, so the interpreter waits for them on
+        exit; the cancel flag makes a running job return early instead.
+        """
+        self._cancel.set()
+        self._executor.shutdown(wait=False)
+        self.window.destroy()
 
 
 def main():
     """Main entry point for the GUI."""
+    logging.basicConfig(level=logging.INFO)
     app = AppScraperGUI()
     app.run()
 
@@ -0,0 +1,45 @@
+"""
+Input validators for the scraping engines.
+Kept free of network/scraper dependencies so the GUI can validate input
+without importing the engines.
+"""
+
+import re
+
+# Package name format, e.g. 'com.instagram.android'. ASCII only, as Android
+# requires; non-ASCII letters and digits are rejected.
+_APP_ID_RE = re.compile(r"[A-Za-z0-9_]+(?:\.[A-Za-z0-9_]+)+")
+
+
+def validate_app_id(app_id: str) -> bool:
+    """
+    Validate if an app ID is in the correct format.
+    
+    Args:
+        app_id: The app's package name to validate
+    
+    Returns:
+        True if valid format, False otherwise
+    """
+    # Dot-separated parts of alphanumerics/underscores, at least two parts
+    return isinstance(app_id, str) and _APP_ID_RE.fullmatch(app_id) is not None
+
+
+def validate_app_name(app_name: str) -> bool:
+    """
+    Validate if an app name/ID is in a reasonable format.
+    
+    Args:
+        app_name: The app's name or ID to validate
+    
+    Returns:
+        True if valid format, False otherwise
+    """
+    if not app_name or not isinstance(app_name, str):
+        return False
+    
+    # Basic validation: should not be empty and should be reasonable length
+    if len(app_name.strip()) < 2:
+        return False
+    
+    return True
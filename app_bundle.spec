@@ -7,15 +7,21 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['app.engine', 'app.appstore_engine', 'app.ui_main', 'app.models'],
+    hiddenimports=['app.engine', 'app.appstore_engine', 'app.async_client'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        'tkinter.test', 'unittest', 'pydoc', 'email.test', 'test',
+        'distutils', 'numpy.testing', 'scipy', 'matplotlib',
+        # Dev tools that leak in when building from a development environment
+        'IPython', 'jedi', 'pytest', '_pytest',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    optimize=2,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
@@ -28,8 +34,8 @@ exe = EXE(
     name='App Store Review Scraper',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
+    strip=True,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -44,8 +50,8 @@ coll = COLLECT(
     a.binaries,
     a.zipfiles,
     a.datas,
-    strip=False,
-    upx=True,
+    strip=True,
+    upx=False,
     upx_exclude=[],
     name='App Store Review Scraper',
 )
@@ -0,0 +1,171 @@
+"""
+Unit tests for the App Store scraping engine.
+Requests are served by httpx.MockTransport, so no network is needed.
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+import orjson
+
+from app import appstore_engine, cache
+
+
+def _feed(*entries):
+    """Build an encoded iTunes RSS feed page."""
+    return orjson.dumps({"feed": {"entry": list(entries)}})
+
+
+def _review(review_id, text="Nice app"):
+    """Build a raw review entry."""
+    return {
+        "id": {"label": review_id},
+        "im:rating": {"label": "5"},
+        "content": {"label": text},
+    }
+
+
+APP_ROW = {
+    "im:name": {"label": "Example App"},
+    "link": {"attributes": {"href": "https://apps.apple.com/app/id284882215"}},
+    "im:image": [{"label": "small.png"}, {"label": "large.png"}],
+}
+
+
+def _paged_feed(calls, per_page=50):
+    """Handler serving full pages whose first review repeats the previous page's last."""
+    def handler(request):
+        calls.append(str(request.url))
+        page = int(str(request.url).split("/page=")[1].split("/")[0])
+        ids = [f"p{page}-{i}" for i in range(per_page)]
+        if page > 1:
+            ids[0] = f"p{page - 1}-{per_page - 1}"
+        return httpx.Response(200, content=_feed(APP_ROW, *[_review(i) for i in ids]))
+
+    return handler
+
+
+def _rate_limited_once(calls):
+    """Handler answering 429 to the first request and a one-review page after."""
+    def handler(request):
+        calls.append(str(request.url))
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, content=_feed(_review("r1")))
+
+    return handler
+
+
+class TestAppStoreEngine(unittest.TestCase):
+    """Test cases for appstore_engine.py functions."""
+
+    def setUp(self):
+        # Results are cached by arguments; keep tests independent
+        cache.clear()
+
+    def _mock_client(self, handler):
+        """Route the sync client through handler for the rest of the test."""
+        patcher = mock.patch.object(
+            appstore_engine, "_client", httpx.Client(transport=httpx.MockTransport(handler))
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_fetch_reviews_fetches_needed_pages(self):
+        """Test that count > 50 requests ceil(count / 50) feed pages."""
+        calls = []
+        self._mock_client(_paged_feed(calls))
+
+        result = appstore_engine.fetch_app_reviews("284882215", count=120)
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(sorted(url.split("/page=")[1][0] for url in calls), ["1", "2", "3"])
+        self.assertEqual(len(result), 120)
+
+    def test_fetch_reviews_single_page(self):
+        """Test that count <= 50 requests only the first page."""
+        calls = []
+        self._mock_client(_paged_feed(calls))
+
+        result = appstore_engine.fetch_app_reviews("284882215", count=50)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(result), 50)
+
+    def test_fetch_reviews_drops_app_row_and_duplicates(self):
+        """Test that the app info row and reviews repeated across pages are dropped."""
+        calls = []
+        self._mock_client(_paged_feed(calls, per_page=3))
+
+        result = appstore_engine.fetch_app_reviews("284882215", count=100)
+
+        ids = [r["review_id"] for r in result]
+        self.assertEqual(ids, ["p1-0", "p1-1", "p1-2", "p2-1", "p2-2"])
+        self.assertTrue(all(r["rating"] == "5" for r in result))
+
+    def test_fetch_reviews_requires_numeric_id(self):
+        """Test that a non-numeric app name without app_id makes no request."""
+        calls = []
+        self._mock_client(_paged_feed(calls))
+
+        result = appstore_engine.fetch_app_reviews("facebook")
+
+        self.assertEqual(calls, [])
+        self.assertIn("error", result[0])
+        self.assertIn("suggestion", result[0])
+
+    def test_info_and_reviews_fill_cache(self):
+        """Test that fetch_app_info_and_reviews serves later single fetches from the cache."""
+        calls = []
+        self._mock_client(_paged_feed(calls))
+
+        app_info, reviews = appstore_engine.fetch_app_info_and_reviews("284882215", count=20)
+        self.assertEqual(app_info["app_name"], "Example App")
+        self.assertEqual(app_info["icon"], "large.png")
+        self.assertEqual(len(reviews), 20)
+        self.assertEqual(len(calls), 1)
+
+        self.assertEqual(appstore_engine.fetch_app_info("284882215"), app_info)
+        self.assertEqual(appstore_engine.fetch_app_reviews("284882215", count=20), reviews)
+        self.assertEqual(len(calls), 1)
+
+    def test_info_without_reviews(self):
+        """Test that a feed holding only the app row (not wrapped in a list) still parses."""
+        self._mock_client(
+            lambda request: httpx.Response(200, content=orjson.dumps({"feed": {"entry": APP_ROW}}))
+        )
+
+        app_info, reviews = appstore_engine.fetch_app_info_and_reviews("124")
+        self.assertEqual(app_info["app_name"], "Example App")
+        self.assertEqual(app_info["icon"], "large.png")
+        self.assertEqual(reviews[0]["error"], "No reviews found for this app")
+
+        cache.clear()
+        self.assertEqual(appstore_engine.fetch_app_info("124")["app_name"], "Example App")
+
+    def test_fetch_reviews_retries_rate_limit(self):
+        """Test that a 429 is retried before giving up on the page."""
+        calls = []
+        self._mock_client(_rate_limited_once(calls))
+
+        result = appstore_engine.fetch_app_reviews("284882215", count=10)
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual([r["review_id"] for r in result], ["r1"])
+
+    def test_fetch_reviews_async_retries_rate_limit(self):
+        """Test that the async fetcher retries a 429 like the sync one."""
+        calls = []
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_rate_limited_once(calls)))
+
+        with mock.patch.object(appstore_engine, "get_async_client", return_value=client):
+            result = asyncio.run(appstore_engine.fetch_app_reviews_async("284882215", count=10))
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual([r["review_id"] for r in result], ["r1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Unit tests for the shared async HTTP client.
+No requests are made; only the client's lifetime is checked.
+"""
+
+import asyncio
+import threading
+import unittest
+
+from app import async_client
+
+
+async def _get_client():
+    """Return the running loop's client, checking it is reused within the loop."""
+    client = async_client.get_async_client()
+    assert client is async_client.get_async_client()
+    return client
+
+
+class TestAsyncClient(unittest.TestCase):
+    """Test cases for async_client.py functions."""
+
+    def test_client_closed_by_asyncio_run(self):
+        """Test that each asyncio.run gets its own client, closed when the loop ends."""
+        first = asyncio.run(_get_client())
+        second = asyncio.run(_get_client())
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.is_closed)
+        self.assertTrue(second.is_closed)
+        self.assertEqual(len(async_client._clients), 0)
+
+    def test_run_in_new_loop_closes_client(self):
+        """Test that run_in_new_loop closes the client before returning."""
+        client = async_client.run_in_new_loop(_get_client)
+
+        self.assertTrue(client.is_closed)
+        self.assertEqual(len(async_client._clients), 0)
+
+    def test_loops_on_threads_get_own_clients(self):
+        """Test that event loops running on different threads never share a client."""
+        clients = {}
+        barrier = threading.Barrier(4)
+
+        async def get_together(i):
+            # Hold every loop open until all have asked for a client
+            clients[i] = async_client.get_async_client()
+            await asyncio.get_running_loop().run_in_executor(None, barrier.wait)
+
+        threads = [
+            threading.Thread(target=asyncio.run, args=(get_together(i),)) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(c) for c in clients.values()}), 4)
+        self.assertTrue(all(c.is_closed for c in clients.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Unit tests for the in-process response cache.
+"""
+
+import asyncio
+import unittest
+
+from app import cache
+
+
+class TestCache(unittest.TestCase):
+    """Test cases for cache.py functions."""
+
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+    def _fetcher(self, result):
+        """Return a fetcher that counts its calls and returns result."""
+        def fetch():
+            self.calls += 1
+            return result
+
+        return fetch
+
+    def test_fresh_hit(self):
+        """Test that a fresh entry is served without calling the fetcher."""
+        first = cache.get_or_fetch("k", 60, self._fetcher({"title": "A"}))
+        second = cache.get_or_fetch("k", 60, self._fetcher({"title": "B"}))
+
+        self.assertEqual(first, {"title": "A"})
+        self.assertEqual(second, {"title": "A"})
+        self.assertEqual(self.calls, 1)
+
+    def test_expired_entry_is_refetched(self):
+        """Test that an expired entry is replaced by a fresh fetch."""
+        cache.get_or_fetch("k", 0, self._fetcher({"title": "A"}))
+        result = cache.get_or_fetch("k", 60, self._fetcher({"title": "B"}))
+
+        self.assertEqual(result, {"title": "B"})
+        self.assertEqual(self.calls, 2)
+
+    def test_stale_entry_served_on_error(self):
+        """Test that an expired entry is returned when the refetch fails."""
+        cache.get_or_fetch("k", 0, self._fetcher([{"review_id": "r1"}]))
+        result = cache.get_or_fetch("k", 60, self._fetcher([{"error": "HTTP 503"}]))
+
+        self.assertEqual(result, [{"review_id": "r1"}])
+        self.assertIsNone(cache.get("k"))
+
+    def test_errors_never_cached(self):
+        """Test that error results are returned but not stored."""
+        error = {"error": "Network error"}
+        self.assertEqual(cache.get_or_fetch("k", 60, self._fetcher(error)), error)
+        cache.put("k2", 60, [error])
+
+        self.assertIsNone(cache.get("k"))
+        self.assertIsNone(cache.get("k2"))
+        cache.get_or_fetch("k", 60, self._fetcher({"title": "A"}))
+        self.assertEqual(self.calls, 2)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        for i in range(cache.MAX_ENTRIES):
+            cache.put(f"k{i}", 60, i)
+        cache.get("k0")  # refresh k0 so k1 becomes the oldest
+        cache.put("new", 60, "new")
+
+        self.assertEqual(cache.get("k0"), 0)
+        self.assertIsNone(cache.get("k1"))
+        self.assertEqual(cache.get("new"), "new")
+
+    def test_make_key_ignores_call_style(self):
+        """Test that positional, keyword and defaulted calls share a key."""
+        def fetch(app_id, country="us"):
+            pass
+
+        key = cache.make_key("ns", fetch, ("com.a",), {})
+        self.assertEqual(key, cache.make_key("ns", fetch, (), {"app_id": "com.a"}))
+        self.assertEqual(key, cache.make_key("ns", fetch, ("com.a", "us"), {}))
+        self.assertNotEqual(key, cache.make_key("ns", fetch, ("com.a",), {"country": "gb"}))
+        self.assertNotEqual(key, cache.make_key("other", fetch, ("com.a",), {}))
+
+    def test_cached_decorator(self):
+        """Test that the decorator caches by arguments for sync and async functions."""
+        @cache.cached("test", 60)
+        def fetch(app_id, country="us"):
+            self.calls += 1
+            return {"app_id": app_id, "country": country}
+
+        @cache.cached("test", 60)
+        async def fetch_async(app_id, country="us"):
+            self.calls += 1
+            return {"app_id": app_id, "country": country}
+
+        fetch("com.a")
+        fetch(app_id="com.a", country="us")
+        fetch("com.a", "gb")
+        self.assertEqual(self.calls, 2)
+
+        asyncio.run(fetch_async("com.a"))
+        result = asyncio.run(fetch_async(app_id="com.a"))
+        self.assertEqual(result, {"app_id": "com.a", "country": "us"})
+        self.assertEqual(self.calls, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
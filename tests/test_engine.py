@@ -2,13 +2,51 @@
 Unit tests for the scraping engine.
 """
 
+import os
 import unittest
-from app.engine import fetch_app_info, fetch_app_reviews
+from contextlib import contextmanager
+from unittest import mock
+
+from app import cache, engine
+from app.engine import fetch_app_info, fetch_app_reviews, validate_app_id
+
+LIVE_TESTS = os.getenv("LIVE_TESTS")
+
+# Trimmed gplay-scraper responses (camelCase, as returned by the library)
+APP_FIXTURE = {
+    "appId": "com.google.android.youtube",
+    "title": "YouTube",
+    "developer": "Google LLC",
+    "score": 4.1,
+    "ratings": 150000000,
+}
+
+REVIEWS_FIXTURE = [
+    {"reviewId": "r1", "userName": "Ann", "score": 5, "text": "Great app", "thumbsUp": 3},
+    {"reviewId": "r2", "userName": "Bob", "score": 2, "text": ""},
+    {"reviewId": "r3", "userName": "Cy", "score": 4, "text": "Works fine"},
+]
+
+
+def _mock_scraper(**methods):
+    """Patch engine._pooled_scraper to hand out a mock client."""
+    client = mock.Mock(**methods)
+
+    @contextmanager
+    def pooled():
+        yield client
+
+    return mock.patch.object(engine, "_pooled_scraper", pooled)
 
 
 class TestEngine(unittest.TestCase):
     """Test cases for engine.py functions."""
 
+    def setUp(self):
+        # Results are cached by arguments; keep tests independent
+        cache.clear()
+
+    @unittest.skipUnless(LIVE_TESTS, "live network test")
     def test_fetch_app_info_basic(self):
         """Test basic app info fetching."""
         # Using a well-known app ID for testing
@@ -19,6 +57,7 @@ class TestEngine(unittest.TestCase):
         self.assertIn("app_id", result)
         self.assertEqual(result["app_id"], app_id)
 
+    @unittest.skipUnless(LIVE_TESTS, "live network test")
     def test_fetch_reviews_basic(self):
         """Test basic review fetching."""
         app_id = "com.google.android.youtube"
@@ -27,11 +66,61 @@ class TestEngine(unittest.TestCase):
         self.assertIsInstance(result, list)
         self.assertLessEqual(len(result), 5)
 
+    @unittest.skipUnless(LIVE_TESTS, "live network test")
     def test_invalid_app_id(self):
         """Test handling of invalid app ID."""
         result = fetch_app_info("invalid.app.id.12345", lang="en", country="us")
         self.assertIn("error", result)
 
+    def test_fetch_app_info_mocked(self):
+        """Test app info mapping against a canned response."""
+        with _mock_scraper(**{"app_analyze.return_value": APP_FIXTURE}):
+            result = fetch_app_info("com.google.android.youtube", lang="en", country="us")
+
+        self.assertEqual(result["app_id"], "com.google.android.youtube")
+        self.assertEqual(result["title"], "YouTube")
+        self.assertEqual(result["rating"], 4.1)
+        self.assertEqual(result["ratings_count"], 150000000)
+
+    def test_fetch_reviews_mocked(self):
+        """Test review mapping and the text_only filter against a canned response."""
+        with _mock_scraper(**{"reviews_analyze.return_value": REVIEWS_FIXTURE}):
+            result = fetch_app_reviews("com.google.android.youtube", count=5)
+            text_only = fetch_app_reviews("com.google.android.youtube", count=5, text_only=True)
+
+        self.assertEqual([r["review_id"] for r in result], ["r1", "r2", "r3"])
+        self.assertEqual(result[0]["thumbs_up"], 3)
+        self.assertEqual(result[1]["thumbs_up"], 0)
+        self.assertEqual([r["review_id"] for r in text_only], ["r1", "r3"])
+
+    def test_invalid_app_id_mocked(self):
+        """Test that a scraper failure comes back as an error dict."""
+        with _mock_scraper(**{"app_analyze.side_effect": Exception("App not found")}):
+            result = fetch_app_info("invalid.app.id.12345", lang="en", country="us")
+
+        self.assertIn("error", result)
+        self.assertEqual(result["app_id"], "invalid.app.id.12345")
+
+    def test_pool_size_from_env(self):
+        """Test GPLAY_POOL_SIZE parsing, including invalid values."""
+        cases = {"3": 3, "0": 1, "": engine._DEFAULT_POOL_SIZE, "abc": engine._DEFAULT_POOL_SIZE}
+        for raw, expected in cases.items():
+            with mock.patch.dict(os.environ, {"GPLAY_POOL_SIZE": raw}):
+                self.assertEqual(engine._pool_size_from_env(), expected)
+
+    def test_validate_app_id(self):
+        """Test package name format validation."""
+        self.assertTrue(validate_app_id("com.google.android.youtube"))
+        self.assertTrue(validate_app_id("com.my_app2.android"))
+        self.assertFalse(validate_app_id("youtube"))
+        self.assertFalse(validate_app_id("com..youtube"))
+        self.assertFalse(validate_app_id("com.you-tube"))
+        self.assertFalse(validate_app_id("com.youtube."))
+        self.assertFalse(validate_app_id("com.appé.x"))
+        self.assertFalse(validate_app_id("com.app٣.x"))
+        self.assertFalse(validate_app_id(""))
+        self.assertFalse(validate_app_id(None))
+
 
 if __name__ == "__main__":
     unittest.main()
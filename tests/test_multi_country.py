@@ -0,0 +1,75 @@
+"""
+Unit tests for the multi-country fetch helpers.
+Requests are served by httpx.MockTransport, so no network is needed.
+"""
+
+import threading
+import unittest
+from unittest import mock
+
+import httpx
+import orjson
+
+from app import appstore_engine, cache, multi_country
+
+
+def _review(review_id, text):
+    """Build a raw review entry."""
+    return {
+        "id": {"label": review_id},
+        "im:rating": {"label": "5"},
+        "content": {"label": text},
+    }
+
+
+class TestMultiCountry(unittest.TestCase):
+    """Test cases for multi_country.py functions."""
+
+    def setUp(self):
+        # Results are cached by arguments; keep tests independent
+        cache.clear()
+
+    def test_fetch_countries_merges_in_caller_order(self):
+        """Test that the first copy of a review is kept in caller order, not finish order."""
+        countries = ["us", "gb", "ca"]
+        answered = {c: threading.Event() for c in countries}
+
+        def handler(request):
+            country = request.url.path.split("/")[1]
+            # Answer in reverse order: each country waits for the one after it
+            index = countries.index(country)
+            if index + 1 < len(countries):
+                answered[countries[index + 1]].wait(timeout=5)
+            answered[country].set()
+            entries = [_review("shared", f"{country} copy"), _review(f"{country}-only", country)]
+            return httpx.Response(200, content=orjson.dumps({"feed": {"entry": entries}}))
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        with mock.patch.object(appstore_engine, "_client", client):
+            result = appstore_engine.fetch_reviews_multi_country(
+                "284882215", countries=countries, count_per_country=10
+            )
+
+        self.assertEqual(
+            [r["review_id"] for r in result], ["shared", "us-only", "gb-only", "ca-only"]
+        )
+        self.assertEqual(result[0]["text"], "us copy")
+        self.assertEqual(
+            [r["fetched_from_country"] for r in result], ["us", "us", "gb", "ca"]
+        )
+
+    def test_merge_skips_errors_and_duplicates(self):
+        """Test that error lists are skipped and later copies of a review are dropped."""
+        result = multi_country.merge_country_reviews([
+            ("us", [{"error": "Network error", "app_id": "284882215"}]),
+            ("gb", [{"review_id": "r1", "text": "gb copy"}, {"review_id": "r2"}]),
+            ("ca", [{"review_id": "r1", "text": "ca copy"}, {"review_id": "r3"}]),
+        ])
+
+        self.assertEqual([r["review_id"] for r in result], ["r1", "r2", "r3"])
+        self.assertEqual(result[0]["text"], "gb copy")
+        self.assertEqual([r["fetched_from_country"] for r in result], ["gb", "gb", "ca"])
+
+
+if __name__ == "__main__":
+    unittest.main()
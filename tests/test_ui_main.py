@@ -0,0 +1,51 @@
+"""
+Unit tests for the GUI's output handling.
+A Tcl interpreter without Tk stands in for the window, so no display is
+needed; widgets are mocks.
+"""
+
+import tkinter
+import unittest
+from unittest import mock
+
+from app import ui_main
+
+
+class TestOutput(unittest.TestCase):
+    """Test cases for chunked output in ui_main.py."""
+
+    def setUp(self):
+        self.gui = object.__new__(ui_main.AppScraperGUI)
+        self.gui.window = tkinter.Tcl()
+        self.gui.output_text = mock.Mock()
+        self.gui.progress_bar = mock.Mock()
+        self.gui._all_buttons = (mock.Mock(), mock.Mock())
+        self.gui._output_gen = 0
+
+    def _inserted(self):
+        """Return the text inserted into the output box so far."""
+        return "".join(c.args[1] for c in self.gui.output_text.insert.call_args_list)
+
+    def test_chunks_stay_pending_after_set_busy(self):
+        """Test that ending a crawl doesn't flush the queued chunk inserts."""
+        text = "x" * (ui_main.OUTPUT_CHUNK_CHARS * 3)
+
+        self.gui._update_output(text)
+        self.gui._set_busy(False)
+
+        self.assertEqual(self.gui.output_text.insert.call_count, 1)
+        self.gui.window.update()
+        self.assertEqual(self.gui.output_text.insert.call_count, 3)
+        self.assertEqual(self._inserted(), text)
+
+    def test_newer_output_drops_pending_chunks(self):
+        """Test that chunks of replaced output are not inserted."""
+        self.gui._update_output("x" * (ui_main.OUTPUT_CHUNK_CHARS * 2))
+        self.gui._update_output("short")
+        self.gui.window.update()
+
+        self.assertEqual(self._inserted(), "x" * ui_main.OUTPUT_CHUNK_CHARS + "short")
+
+
+if __name__ == "__main__":
+    unittest.main()